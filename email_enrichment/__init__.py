@@ -1,2 +1 @@
 """Email validation pipeline package."""
-
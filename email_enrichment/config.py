@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,16 +11,39 @@ load_dotenv()
 PROJECT_DIR = Path(__file__).parent
 
 # Reacher API configuration
-REACHER_API_URL = os.getenv("REACHER_API_URL", "'https://api.reacher.email")
+REACHER_API_URL = os.getenv("REACHER_API_URL", "https://api.reacher.email")
+if urlparse(REACHER_API_URL).scheme not in ("http", "https"):
+    raise ValueError(f"REACHER_API_URL must be an http(s) URL, got {REACHER_API_URL!r}")
 REACHER_API_KEY = os.getenv("REACHER_API_KEY", "")  # Only needed for managed Reacher
+REACHER_RPS = float(os.getenv("REACHER_RPS", "5.0"))  # Max requests/second to Reacher
+REACHER_ASYNC = (
+    os.getenv("REACHER_ASYNC", "true").lower() == "true"
+)  # asyncio client; "false" uses the threaded requests client
+REACHER_CONCURRENCY = int(
+    os.getenv("REACHER_CONCURRENCY", "100")
+)  # Max in-flight requests for the asyncio client
 
 # Input/Output configuration (relative to project directory)
 INPUT_LEADS_CSV = str(PROJECT_DIR / "input" / "leads.csv")
 OUTPUT_DIR = PROJECT_DIR / "output"
+PATTERN_PRIORS_PATH = OUTPUT_DIR / "pattern_priors.json"  # Learned per-domain formats
+REACHER_CACHE_PATH = OUTPUT_DIR / "reacher_cache.sqlite"  # Cached Reacher responses
+
+# Cache settings
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+CACHE_INVALID_TTL_SECONDS = int(
+    os.getenv("CACHE_INVALID_TTL_SECONDS", str(7 * 24 * 3600))
+)  # Dead addresses churn faster
 
 # Validation settings
+LEADS_CHUNK_SIZE = int(os.getenv("LEADS_CHUNK_SIZE", "50000"))  # Rows read at a time
 VALIDATION_DELAY_SECONDS = float(os.getenv("VALIDATION_DELAY_SECONDS", "1.5"))
 MAX_PATTERNS_PER_LEAD = int(os.getenv("MAX_PATTERNS_PER_LEAD", "20"))
+MAX_CONCURRENT_DOMAINS = int(
+    os.getenv("MAX_CONCURRENT_DOMAINS", "32")
+)  # Domains validated in parallel
+MX_LOOKUP_TIMEOUT_SECONDS = float(os.getenv("MX_LOOKUP_TIMEOUT_SECONDS", "3.0"))
+MX_LOOKUP_WORKERS = int(os.getenv("MX_LOOKUP_WORKERS", "32"))  # Parallel DNS lookups
 INCLUDE_RISKY = (
     os.getenv("INCLUDE_RISKY", "false").lower() == "true"
 )  # Catch-all addresses
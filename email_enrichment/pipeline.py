@@ -10,22 +10,57 @@ Finds verified work emails that never made it into public databases by:
 Original post: https://sarthakmishra.com/blog/how-to-find-and-validate-work-emails
 """
 
+import asyncio
+import csv
+import functools
+import json
 import logging
+import sqlite3
+import threading
 import time
 import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
+import dns.exception
+import dns.resolver
+import httpx
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import (
+    CACHE_INVALID_TTL_SECONDS,
+    CACHE_TTL_SECONDS,
     INCLUDE_RISKY,
+    LEADS_CHUNK_SIZE,
+    MAX_CONCURRENT_DOMAINS,
+    MX_LOOKUP_TIMEOUT_SECONDS,
+    MX_LOOKUP_WORKERS,
     MAX_PATTERNS_PER_LEAD,
     OUTPUT_DIR,
+    PATTERN_PRIORS_PATH,
     REACHER_API_KEY,
     REACHER_API_URL,
+    REACHER_ASYNC,
+    REACHER_CACHE_PATH,
+    REACHER_CONCURRENCY,
+    REACHER_RPS,
     VALIDATION_DELAY_SECONDS,
     INPUT_LEADS_CSV,
 )
@@ -36,6 +71,40 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()],
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO, which floods the log under concurrency
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Email formats as (template_id, builder) ordered by prevalence. Builders take
+# (first, last, first_initial, last_initial, domain) and only use "+", so they
+# build a whole pandas Series of emails at once. IDs are persisted in the
+# pattern priors file and must stay stable.
+_PATTERN_TEMPLATES: List[Tuple[int, Callable[..., Any]]] = [
+    (0, lambda f, l, fi, li, d: f + "@" + d),
+    (1, lambda f, l, fi, li, d: f + "." + l + "@" + d),
+    (2, lambda f, l, fi, li, d: f + l + "@" + d),
+    (3, lambda f, l, fi, li, d: fi + "." + l + "@" + d),
+    (4, lambda f, l, fi, li, d: fi + l + "@" + d),
+    (5, lambda f, l, fi, li, d: f + "_" + l + "@" + d),
+    (6, lambda f, l, fi, li, d: f + "-" + l + "@" + d),
+    (7, lambda f, l, fi, li, d: f + "." + li + "@" + d),
+    (8, lambda f, l, fi, li, d: l + "." + f + "@" + d),
+]
+
+# Leads CSV columns needed to generate patterns; any others are passed through
+_REQUIRED_LEAD_COLUMNS = ("first_name", "last_name", "company_domain")
+
+# (lead index, lead row, first name, last name, domain, [(template_id, email), ...])
+LeadTask = Tuple[int, Dict[str, Any], str, str, str, List[Tuple[int, str]]]
+
+# Reacher responses retried with backoff: throttling and gateway errors
+_RETRY_STATUSES = (429, 502, 503, 504)
+_MAX_RETRIES = 3
+_RETRY_BACKOFF_SECONDS = 0.5
+
+# Connecting to Reacher should be near-instant, so unreachable deployments
+# fail in seconds; reads cover Reacher's SMTP conversation with the mail server
+_CONNECT_TIMEOUT_SECONDS = 3.05
+_READ_TIMEOUT_SECONDS = 30.0
 
 
 def _timestamped_filename(prefix: str, suffix: str) -> str:
@@ -44,98 +113,174 @@ def _timestamped_filename(prefix: str, suffix: str) -> str:
     return f"{prefix}_{stamp}.{suffix}"
 
 
-def generate_name_variants(first: str, last: str) -> List[Tuple[str, str]]:
+@functools.lru_cache(maxsize=4096)
+def _mx_records(domain: str) -> Optional[Tuple[str, ...]]:
     """
-    Generate name variants to handle hyphenated and accented names.
+    Resolve MX hosts for a domain.
 
-    Examples:
-    - "Jean-Pierre" -> ("Jean-Pierre", "Jean", "JeanPierre")
-    - "María José" -> ("María José", "Maria Jose")
+    Returns an empty tuple when the domain has no MX records (NXDOMAIN or no
+    answer) and None when the lookup itself failed, so callers only skip
+    domains that are known to be undeliverable.
     """
-    variants = [
-        (first, last),
-        (first.replace("-", ""), last),  # Remove hyphen
-        (first.split("-")[0], last),  # Use first part only
-    ]
-
-    # Handle accented characters: María -> Maria, José -> Jose
-    if any(ord(c) > 127 for c in first + last):
-        first_ascii = "".join(
-            c
-            for c in unicodedata.normalize("NFD", first)
-            if unicodedata.category(c) != "Mn"
-        )
-        last_ascii = "".join(
-            c
-            for c in unicodedata.normalize("NFD", last)
-            if unicodedata.category(c) != "Mn"
-        )
-        variants.append((first_ascii, last_ascii))
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_variants = []
-    for variant in variants:
-        if variant not in seen:
-            seen.add(variant)
-            unique_variants.append(variant)
-
-    return unique_variants
+    try:
+        answer = dns.resolver.resolve(domain, "MX", lifetime=MX_LOOKUP_TIMEOUT_SECONDS)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        return ()
+    except dns.exception.DNSException as err:
+        logger.warning("MX lookup failed for %s: %s", domain, err)
+        return None
+    hosts = (str(record.exchange).rstrip(".") for record in answer)
+    # A "null MX" (RFC 7505) has an empty exchange and explicitly accepts no mail
+    return tuple(host for host in hosts if host)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _ascii_fold(name: str) -> str:
+    """Strip combining accents (María -> Maria), memoized per distinct name."""
+    if name.isascii():
+        return name
+    return "".join(
+        c for c in unicodedata.normalize("NFD", name) if unicodedata.category(c) != "Mn"
+    )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
 
+    Tokens refill continuously at `rate` per second up to `capacity`; acquire()
+    only sleeps when the bucket is empty, so time already spent waiting on
+    responses counts towards the rate. A non-positive rate disables limiting.
+    """
 
-def generate_email_patterns(first_name: str, last_name: str, domain: str) -> List[str]:
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.refill_rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Consume a token if one is available, else return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.refill_rate,
+            )
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.refill_rate
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        if self.refill_rate <= 0:
+            return
+        while (wait := self._take()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like acquire(), but yields to the event loop while waiting."""
+        if self.refill_rate <= 0:
+            return
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
+
+
+def _flatten_reacher_result(result: Optional[Dict]) -> Dict[str, Any]:
+    """Extract the output fields from a (possibly missing) Reacher response."""
+    if not result:
+        return {
+            "is_reachable": "",
+            "is_reachable_smtp": False,
+            "is_disposable": False,
+            "is_role_account": False,
+            "mx_records": "",
+        }
+    # `or {}` also covers sections the API returns as null
+    smtp = result.get("smtp") or {}
+    misc = result.get("misc") or {}
+    mx_records = (result.get("mx") or {}).get("records") or []
+    return {
+        "is_reachable": result.get("is_reachable", ""),
+        "is_reachable_smtp": smtp.get("is_deliverable", False),
+        "is_disposable": misc.get("is_disposable", False),
+        "is_role_account": misc.get("is_role_account", False),
+        "mx_records": ", ".join(mx_records),
+    }
+
+
+def _log_level(err: Exception) -> int:
     """
-    Generate email pattern variations based on common corporate email formats.
-
-    Patterns ordered by prevalence (most common first):
-    - firstname@domain (Very High)
-    - firstname.lastname@domain (Very High)
-    - firstlast@domain (High)
-    - f.lastname@domain (Medium)
-    - first_last@domain (Medium)
-    - first-last@domain (Low)
-    - firstname.lastinitial@domain (Low)
-    - lastname.firstname@domain (Low)
+    Log level for a failed Reacher call.
+
+    Read timeouts are routine with slow recipient mail servers; anything else
+    (notably connect failures) means Reacher itself is in trouble.
     """
-    first = first_name.lower().strip()
-    last = last_name.lower().strip()
-
-    if not first or not last or not domain:
-        return []
-
-    patterns = [
-        f"{first}@{domain}",
-        f"{first}.{last}@{domain}",
-        f"{first}{last}@{domain}",
-        f"{first[0]}.{last}@{domain}",
-        f"{first[0]}{last}@{domain}",
-        f"{first}_{last}@{domain}",
-        f"{first}-{last}@{domain}",
-        f"{first}.{last[0]}@{domain}",
-        f"{last}.{first}@{domain}",
-    ]
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_patterns = []
-    for pattern in patterns:
-        if pattern not in seen:
-            seen.add(pattern)
-            unique_patterns.append(pattern)
-
-    return unique_patterns[:MAX_PATTERNS_PER_LEAD]
+    if isinstance(err, (requests.exceptions.ReadTimeout, httpx.ReadTimeout)):
+        return logging.WARNING
+    return logging.ERROR
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring a Retry-After header."""
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return _RETRY_BACKOFF_SECONDS * 2**attempt
+
+
+def _error_result(email: str, err: Exception, level: int = logging.ERROR) -> Dict:
+    """Result returned in place of a Reacher response when the call fails."""
+    # Some exceptions (e.g. httpx timeouts) have an empty message
+    message = str(err) or type(err).__name__
+    logger.log(level, "Reacher API error for %s: %s", email, message)
+    return {
+        "is_reachable": "invalid",
+        "is_reachable_smtp": False,
+        "can_connect_smtp": False,
+        "error": message,
+    }
 
 
 class ReacherClient:
     """Client for Reacher email validation API (self-hosted or managed)."""
 
-    def __init__(self, api_url: str, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self, api_url: str, api_key: Optional[str] = None, pool_size: int = 32
+    ) -> None:
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key
         self.headers = {"Content-Type": "application/json"}
         if api_key:
             self.headers["Authorization"] = f"Bearer {api_key}"
 
+        # Shared session so worker threads reuse pooled keep-alive connections
+        # to Reacher instead of a new TCP/TLS handshake per email. Checks are
+        # idempotent, so POSTs are safe to retry on throttling/gateway errors.
+        # Connect and read errors are not retried: an unreachable Reacher or a
+        # slow mail server would only fail again after another full timeout.
+        # (read=False re-raises the original error, so read timeouts surface
+        # as ReadTimeout rather than a generic ConnectionError.)
+        retry = Retry(
+            total=_MAX_RETRIES,
+            connect=0,
+            read=False,
+            backoff_factor=_RETRY_BACKOFF_SECONDS,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods={"POST"},
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+
     def validate_email(self, email: str) -> Dict:
         """
         Validate a single email address using SMTP.
@@ -153,19 +298,15 @@ class ReacherClient:
         payload = {"to_email": email}
 
         try:
-            resp = requests.post(
-                endpoint, headers=self.headers, json=payload, timeout=30
+            resp = self.session.post(
+                endpoint,
+                json=payload,
+                timeout=(_CONNECT_TIMEOUT_SECONDS, _READ_TIMEOUT_SECONDS),
             )
             resp.raise_for_status()
             return resp.json()
         except requests.exceptions.RequestException as err:
-            logger.error("Reacher API error for %s: %s", email, err)
-            return {
-                "is_reachable": "invalid",
-                "is_reachable_smtp": False,
-                "can_connect_smtp": False,
-                "error": str(err),
-            }
+            return _error_result(email, err, _log_level(err))
 
     def validate_batch(self, emails: List[str], delay: float = 1.5) -> List[Dict]:
         """
@@ -194,50 +335,442 @@ class ReacherClient:
         return results
 
 
+class AsyncReacherClient:
+    """
+    asyncio client for the Reacher API, for many checks in flight at once.
+
+    Returns the same result dicts as ReacherClient. At most `max_concurrency`
+    requests run concurrently, over a shared keep-alive connection pool. Use
+    as an async context manager so the pool is closed with the event loop.
+    """
+
+    def __init__(
+        self, api_url: str, api_key: Optional[str] = None, max_concurrency: int = 100
+    ) -> None:
+        self.api_url = api_url.rstrip("/")
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max(max_concurrency // 2, 1),
+            ),
+            timeout=httpx.Timeout(
+                _READ_TIMEOUT_SECONDS, connect=_CONNECT_TIMEOUT_SECONDS
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> "AsyncReacherClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.client.aclose()
+
+    async def validate_email(self, email: str) -> Dict:
+        """Validate a single email address using SMTP (see ReacherClient)."""
+        endpoint = f"{self.api_url}/v0/check_email"
+        try:
+            resp = await self._post(endpoint, {"to_email": email})
+            return resp.json()
+        except (httpx.HTTPError, ValueError) as err:
+            return _error_result(email, err, _log_level(err))
+
+    async def _post(self, endpoint: str, payload: Dict) -> httpx.Response:
+        """POST under the concurrency limit, retrying throttling/gateway errors."""
+        async with self._semaphore:
+            # Same retry policy as the synchronous client's urllib3 Retry
+            for attempt in range(_MAX_RETRIES + 1):
+                resp = await self.client.post(endpoint, json=payload)
+                if resp.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    break
+                await asyncio.sleep(_retry_delay(resp, attempt))
+        resp.raise_for_status()
+        return resp
+
+
+class Status(IntEnum):
+    """Reacher `is_reachable` verdicts, ordered from worst to best."""
+
+    INVALID = 0
+    RISKY = 1
+    SAFE = 2
+
+
+# Anything else Reacher reports (e.g. "unknown") counts as invalid
+_STATUS_BY_NAME = {status.name.lower(): status for status in Status}
+
+
+class _LeadSearch:
+    """Tracks the best email found while a lead's patterns are validated."""
+
+    # Risky (catch-all) addresses are only kept when INCLUDE_RISKY is set
+    _MIN_STATUS = Status.RISKY if INCLUDE_RISKY else Status.SAFE
+
+    def __init__(self) -> None:
+        self.best_email: Optional[str] = None
+        self.best_rank = Status.INVALID
+        self.best_result: Optional[Dict] = None
+        self.patterns_tested = 0
+        self.patterns_validated = 0
+
+    @property
+    def best_status(self) -> Optional[str]:
+        """Reacher status of the best email found, if any."""
+        return self.best_rank.name.lower() if self.best_email else None
+
+    def add(self, pattern: str, result: Dict) -> bool:
+        """Record the result for one pattern; returns True once it is "safe"."""
+        self.patterns_tested += 1
+        result["email"] = pattern
+
+        status = _STATUS_BY_NAME.get(result.get("is_reachable"), Status.INVALID)
+        # Parse nested structure: smtp.is_deliverable indicates SMTP validation success
+        smtp_data = result.get("smtp") or {}
+        is_reachable_smtp = smtp_data.get("is_deliverable", False)
+
+        # Track validated patterns
+        if is_reachable_smtp:
+            self.patterns_validated += 1
+
+        # Keep the best acceptable email; a risky one is a fallback while the
+        # search continues for a safe one
+        if is_reachable_smtp and status >= self._MIN_STATUS and status > self.best_rank:
+            self.best_email = pattern
+            self.best_rank = status
+            self.best_result = result
+
+        # "safe" is the best status - stop immediately
+        return self.best_rank == Status.SAFE
+
+
 class EmailValidationPipeline:
     """End-to-end email pattern generation and validation pipeline."""
 
+    # Output columns written ahead of the lead's remaining columns
+    _PRIORITY_COLUMNS: Tuple[str, ...] = (
+        "first_name",
+        "last_name",
+        "company_domain",
+        "validated_email",
+        "validation_status",
+        "is_reachable",
+        "is_reachable_smtp",
+        "is_disposable",
+        "is_role_account",
+        "patterns_tested",
+        "patterns_validated",
+        "mx_records",
+    )
+    _PRIORITY_SET = frozenset(_PRIORITY_COLUMNS)
+
     def __init__(self) -> None:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        self.reacher_client = ReacherClient(REACHER_API_URL, REACHER_API_KEY)
+        self.reacher_client = ReacherClient(
+            REACHER_API_URL, REACHER_API_KEY, pool_size=MAX_CONCURRENT_DOMAINS
+        )
+        self.pattern_priors: Dict[str, Counter] = self._load_pattern_priors()
+        # Caps total request rate to Reacher across all domain workers
+        self.rate_limiter = TokenBucket(REACHER_RPS, capacity=REACHER_RPS)
+        # Cache of Reacher responses shared by all worker threads
+        self.cache = sqlite3.connect(REACHER_CACHE_PATH, check_same_thread=False)
+        self.cache.execute(
+            "CREATE TABLE IF NOT EXISTS reacher_results "
+            "(email TEXT PRIMARY KEY, expires_at INTEGER, payload TEXT)"
+        )
+        self._cache_lock = threading.Lock()
+        # Output CSV, opened by run(); records are written as leads finish
+        self._output: Optional[IO[str]] = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._write_lock = threading.Lock()
 
     def run(self) -> None:
         """Execute the pipeline."""
         logger.info("=== Starting Email Validation Pipeline ===")
-        leads_df = self._load_leads()
-        validated_df = self._validate_leads(leads_df)
-        self._export_csv(validated_df)
-        logger.info("=== Pipeline complete. validated_leads=%s ===", len(validated_df))
+        # Check the input before creating an output file for it
+        lead_columns = self._read_leads_header()
+        self._check_reacher_reachable()
+        output_file = OUTPUT_DIR / _timestamped_filename("validated_emails", "csv")
+        total_validated = 0
+        try:
+            with output_file.open("w", newline="", encoding="utf-8") as f:
+                self._output = f
+                self._writer = csv.DictWriter(
+                    f,
+                    fieldnames=self._output_columns(lead_columns),
+                    extrasaction="ignore",
+                )
+                self._writer.writeheader()
+                for leads_df in self._load_leads():
+                    if REACHER_ASYNC:
+                        total_validated += asyncio.run(
+                            self._validate_leads_async(leads_df)
+                        )
+                    else:
+                        total_validated += self._validate_leads(leads_df)
+            logger.info(
+                "Exported %s validated leads to %s", total_validated, output_file
+            )
+            self._save_pattern_priors()
+        finally:
+            self.cache.close()
+        logger.info("=== Pipeline complete. validated_leads=%s ===", total_validated)
+
+    def _check_reacher_reachable(self) -> None:
+        """Exit early if Reacher cannot be reached, rather than timing out per email."""
+        try:
+            # Any HTTP response (even 404/405 for HEAD /) shows the host is up
+            requests.head(REACHER_API_URL, timeout=5)
+        except requests.exceptions.RequestException as err:
+            raise SystemExit(f"Reacher unreachable at {REACHER_API_URL}: {err}")
+
+    def _load_pattern_priors(self) -> Dict[str, Counter]:
+        """Load per-domain counts of which pattern templates validated as safe."""
+        if not PATTERN_PRIORS_PATH.exists():
+            return {}
+        try:
+            with PATTERN_PRIORS_PATH.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as err:
+            logger.warning(
+                "Ignoring unreadable pattern priors at %s: %s", PATTERN_PRIORS_PATH, err
+            )
+            return {}
+        priors = {
+            domain: Counter({int(tid): count for tid, count in counts.items()})
+            for domain, counts in data.items()
+        }
+        logger.info("Loaded pattern priors for %s domains.", len(priors))
+        return priors
+
+    def _save_pattern_priors(self) -> None:
+        """Persist pattern priors so later runs try the winning format first."""
+        data = {
+            domain: {str(tid): count for tid, count in counts.items()}
+            for domain, counts in self.pattern_priors.items()
+            if counts
+        }
+        with PATTERN_PRIORS_PATH.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        logger.info(
+            "Saved pattern priors for %s domains to %s", len(data), PATTERN_PRIORS_PATH
+        )
 
-    def _load_leads(self) -> pd.DataFrame:
-        """Load the input leads CSV."""
+    def _cached_validate(self, email: str, domain_limiter: TokenBucket) -> Dict:
+        """
+        Validate an email, reusing a cached Reacher response when still fresh.
+
+        Only cache misses wait on the rate limiters.
+        """
+        cached = self._cache_get(email)
+        if cached is not None:
+            return cached
+        domain_limiter.acquire()
+        self.rate_limiter.acquire()
+        result = self.reacher_client.validate_email(email)
+        self._cache_put(email, result)
+        return result
+
+    async def _cached_validate_async(
+        self, client: AsyncReacherClient, email: str, domain_limiter: TokenBucket
+    ) -> Dict:
+        """Async counterpart of _cached_validate()."""
+        cached = self._cache_get(email)
+        if cached is not None:
+            return cached
+        await domain_limiter.acquire_async()
+        await self.rate_limiter.acquire_async()
+        result = await client.validate_email(email)
+        self._cache_put(email, result)
+        return result
+
+    def _cache_get(self, email: str) -> Optional[Dict]:
+        """Return the cached Reacher response for an email if still fresh."""
+        with self._cache_lock:
+            row = self.cache.execute(
+                "SELECT payload FROM reacher_results WHERE email = ? AND expires_at > ?",
+                (email.lower(), int(time.time())),
+            ).fetchone()
+        if not row:
+            return None
+        logger.info("Cache hit for %s", email)
+        return json.loads(row[0])
+
+    def _cache_put(self, email: str, result: Dict) -> None:
+        """
+        Cache a Reacher response.
+
+        Responses from failed API calls are not cached; invalid addresses
+        expire sooner than others.
+        """
+        if "error" in result:
+            return
+
+        ttl = (
+            CACHE_INVALID_TTL_SECONDS
+            if result.get("is_reachable") == "invalid"
+            else CACHE_TTL_SECONDS
+        )
+        with self._cache_lock:
+            self.cache.execute(
+                "INSERT OR REPLACE INTO reacher_results VALUES (?, ?, ?)",
+                (email.lower(), int(time.time()) + ttl, json.dumps(result)),
+            )
+            self.cache.commit()
+
+    def _read_leads_header(self) -> pd.Index:
+        """Check the leads CSV exists and has the required columns; return them all."""
         if not Path(INPUT_LEADS_CSV).exists():
             raise FileNotFoundError(
                 f"Lead file not found at {INPUT_LEADS_CSV}. Set INPUT_LEADS_CSV or create the file."
             )
-        df = pd.read_csv(INPUT_LEADS_CSV)
-        required_cols = {"first_name", "last_name", "company_domain"}
-        missing = required_cols - set(df.columns)
+        header = pd.read_csv(INPUT_LEADS_CSV, nrows=0)
+        missing = set(_REQUIRED_LEAD_COLUMNS) - set(header.columns)
         if missing:
             raise ValueError(
                 f"Missing required columns in leads CSV: {sorted(missing)}. "
                 "Required: first_name, last_name, company_domain"
             )
-        logger.info("Loaded leads CSV with %s rows.", len(df))
-        return df
+        return header.columns
+
+    def _load_leads(self) -> Iterator[pd.DataFrame]:
+        """
+        Stream the input leads CSV in chunks of LEADS_CHUNK_SIZE rows.
+
+        Memory stays bounded regardless of file size; each chunk is validated
+        and exported before the next one is read. Call _read_leads_header()
+        first to check the file.
+        """
+        with pd.read_csv(
+            INPUT_LEADS_CSV,
+            chunksize=LEADS_CHUNK_SIZE,
+            dtype={col: "string" for col in _REQUIRED_LEAD_COLUMNS},
+            engine="c",
+        ) as reader:
+            required = list(_REQUIRED_LEAD_COLUMNS)
+            for df in reader:
+                # Treat empty cells as missing values rather than "<NA>"
+                df[required] = df[required].fillna("")
+                if df.empty:
+                    logger.info("Loaded leads CSV chunk with 0 rows.")
+                else:
+                    logger.info(
+                        "Loaded leads CSV chunk with %s rows (rows %s-%s).",
+                        len(df),
+                        df.index[0],
+                        df.index[-1],
+                    )
+                yield df
 
-    def _validate_leads(self, leads_df: pd.DataFrame) -> pd.DataFrame:
+    def _validate_leads(self, leads_df: pd.DataFrame) -> int:
         """
         Generate email patterns and validate them for each lead.
 
-        Returns DataFrame with validated emails and their status.
+        Each lead's record is written to the output CSV as soon as it is
+        validated. Returns the number of leads written.
         """
-        validated_records = []
+        leads_by_domain = self._group_leads(leads_df)
+        if not leads_by_domain:
+            return 0
+
+        mx_map = self._resolve_mx(leads_by_domain)
+
+        max_workers = min(MAX_CONCURRENT_DOMAINS, len(leads_by_domain))
+        logger.info(
+            "Validating %s domains with %s workers",
+            len(leads_by_domain),
+            max_workers,
+        )
 
-        for idx, lead in leads_df.iterrows():
-            first_name = str(lead.get("first_name", "")).strip()
-            last_name = str(lead.get("last_name", "")).strip()
-            domain = str(lead.get("company_domain", "")).strip()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._validate_domain,
+                    domain,
+                    domain_leads,
+                    mx_map[domain.lower()],
+                )
+                for domain, domain_leads in leads_by_domain.items()
+            ]
+            return sum(future.result() for future in futures)
+
+    async def _validate_leads_async(self, leads_df: pd.DataFrame) -> int:
+        """Async counterpart of _validate_leads(), run on a single event loop."""
+        leads_by_domain = self._group_leads(leads_df)
+        if not leads_by_domain:
+            return 0
+
+        # Lookups happen before any validation starts, so blocking the event
+        # loop here holds nothing up
+        mx_map = self._resolve_mx(leads_by_domain)
+
+        logger.info(
+            "Validating %s domains with up to %s concurrent requests",
+            len(leads_by_domain),
+            REACHER_CONCURRENCY,
+        )
+
+        async with AsyncReacherClient(
+            REACHER_API_URL, REACHER_API_KEY, max_concurrency=REACHER_CONCURRENCY
+        ) as client:
+            counts = await asyncio.gather(
+                *(
+                    self._validate_domain_async(
+                        client, domain, domain_leads, mx_map[domain.lower()]
+                    )
+                    for domain, domain_leads in leads_by_domain.items()
+                )
+            )
+        return sum(counts)
+
+    def _resolve_mx(
+        self, domains: Iterable[str]
+    ) -> Dict[str, Optional[Tuple[str, ...]]]:
+        """Look up MX records for many domains concurrently, keyed by lowercase."""
+        unique_domains = list(dict.fromkeys(domain.lower() for domain in domains))
+        # DNS lookups are dominated by resolver round-trips, so threads overlap
+        max_workers = max(min(MX_LOOKUP_WORKERS, len(unique_domains)), 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            mx_map = dict(
+                zip(unique_domains, executor.map(_mx_records, unique_domains))
+            )
+        logger.info("Resolved MX records for %s domains", len(mx_map))
+        return mx_map
+
+    def _group_leads(self, leads_df: pd.DataFrame) -> Dict[str, List[LeadTask]]:
+        """Build validation tasks for valid leads, grouped by company domain."""
+        patterns_df = self._prepare_patterns_df(leads_df)
+        patterns_by_lead: Dict[int, List[Tuple[int, str]]] = {}
+        for lead_idx, template_id, email in patterns_df.itertuples(
+            index=False, name=None
+        ):
+            patterns_by_lead.setdefault(lead_idx, []).append((template_id, email))
+
+        # Group leads by domain: domains are validated concurrently, while leads
+        # and patterns within a single domain stay serialized to respect the
+        # recipient mail server's rate limits.
+        leads_by_domain: Dict[str, List[LeadTask]] = {}
+
+        # Missing optional values are written as empty cells; filling them per
+        # column here keeps per-value checks out of the row loop
+        leads_df = leads_df.fillna("")
+
+        # itertuples avoids boxing each row as a Series; position 0 is the index
+        columns = list(leads_df.columns)
+        col_idx = {col: pos for pos, col in enumerate(columns, 1)}
+        first_pos = col_idx["first_name"]
+        last_pos = col_idx["last_name"]
+        domain_pos = col_idx["company_domain"]
+
+        for row in leads_df.itertuples(index=True, name=None):
+            idx = row[0]
+            # Required columns are loaded as strings with missing values as ""
+            first_name = row[first_pos].strip()
+            last_name = row[last_pos].strip()
+            domain = row[domain_pos].strip()
 
             if not first_name or not last_name or not domain:
                 logger.warning(
@@ -246,166 +779,302 @@ class EmailValidationPipeline:
                 )
                 continue
 
-            # Generate name variants (handles hyphenated/accented names)
-            name_variants = generate_name_variants(first_name, last_name)
+            lead = dict(zip(columns, row[1:]))
+            # Domains are case-insensitive: "Acme.com" and "acme.com" share a
+            # mail server and so must share one serialized group. Each lead
+            # keeps the domain as given for its output record.
+            leads_by_domain.setdefault(domain.lower(), []).append(
+                (
+                    idx,
+                    lead,
+                    first_name,
+                    last_name,
+                    domain,
+                    patterns_by_lead.get(idx, []),
+                )
+            )
+
+        return leads_by_domain
 
-            # Generate email patterns for each name variant
-            all_patterns = []
-            for first_var, last_var in name_variants:
-                patterns = generate_email_patterns(first_var, last_var, domain)
-                all_patterns.extend(patterns)
+    def _prepare_patterns_df(self, leads_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Generate email patterns for all leads at once with pandas string ops.
+
+        Each lead's name is tried as given and as variants for hyphenated and
+        accented names ("Jean-Pierre" -> "JeanPierre", "Jean"; "María José" ->
+        "Maria Jose"), each in every _PATTERN_TEMPLATES format. The template_id
+        is stable across name variants, so it can be used to learn per-domain
+        formats. Returns a long-form DataFrame with columns lead_idx,
+        template_id, email, ordered by lead, then name variant, then pattern
+        prevalence.
+        """
+        first = leads_df["first_name"].astype(str).str.strip().str.normalize("NFC")
+        last = leads_df["last_name"].astype(str).str.strip().str.normalize("NFC")
+        domain = leads_df["company_domain"].astype(str).str.strip()
+
+        # NFC (above) lets composed and decomposed accents dedupe together; the
+        # accent-folded variant is identical to the original for ASCII names
+        # and is deduplicated below
+        name_variants = [
+            (first, last),
+            (first.str.replace("-", "", regex=False), last),
+            (first.str.split("-").str[0], last),
+            (first.map(_ascii_fold), last.map(_ascii_fold)),
+        ]
+
+        frames = []
+        for variant_id, (first_var, last_var) in enumerate(name_variants):
+            fn = first_var.str.lower().str.strip()
+            ln = last_var.str.lower().str.strip()
+            fi = fn.str[0]
+            li = ln.str[0]
+            has_parts = (fn != "") & (ln != "") & (domain != "")
+            for template_id, template in _PATTERN_TEMPLATES:
+                emails = template(fn, ln, fi, li, domain)
+                frames.append(
+                    pd.DataFrame(
+                        {
+                            "lead_idx": leads_df.index,
+                            "lead_pos": range(len(leads_df)),
+                            "variant_id": variant_id,
+                            "template_id": template_id,
+                            "email": emails.to_numpy(),
+                        }
+                    )[has_parts.to_numpy()]
+                )
 
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_patterns = []
-            for pattern in all_patterns:
-                if pattern not in seen:
-                    seen.add(pattern)
-                    unique_patterns.append(pattern)
+        columns = ["lead_idx", "template_id", "email"]
+        if not frames:
+            return pd.DataFrame(columns=columns)
 
-            logger.info(
-                "Lead %s: Generated %s email patterns for %s %s @ %s",
+        patterns_df = pd.concat(frames, ignore_index=True).sort_values(
+            ["lead_pos", "variant_id", "template_id"], kind="stable"
+        )
+        # Dedupe and cap each variant's patterns, then dedupe across variants
+        # keeping the first occurrence
+        patterns_df = patterns_df.drop_duplicates(["lead_pos", "variant_id", "email"])
+        patterns_df = patterns_df[
+            patterns_df.groupby(["lead_pos", "variant_id"]).cumcount()
+            < MAX_PATTERNS_PER_LEAD
+        ]
+        patterns_df = patterns_df.drop_duplicates(["lead_pos", "email"])
+        return patterns_df[columns].reset_index(drop=True)
+
+    def _validate_domain(
+        self,
+        domain: str,
+        domain_leads: List[LeadTask],
+        mx_records: Optional[Tuple[str, ...]],
+    ) -> int:
+        """Validate all leads for a single domain sequentially."""
+        # Skip all Reacher calls for domains that cannot receive mail
+        if mx_records == ():
+            return self._skip_no_mx_domain(domain, domain_leads)
+
+        domain_limiter = self._domain_limiter()
+        for idx, lead, first_name, last_name, lead_domain, patterns in domain_leads:
+            record = self._validate_lead(
+                idx, lead, first_name, last_name, lead_domain, patterns, domain_limiter
+            )
+            self._write_record(record)
+        return len(domain_leads)
+
+    async def _validate_domain_async(
+        self,
+        client: AsyncReacherClient,
+        domain: str,
+        domain_leads: List[LeadTask],
+        mx_records: Optional[Tuple[str, ...]],
+    ) -> int:
+        """Async counterpart of _validate_domain(); other domains run meanwhile."""
+        if mx_records == ():
+            return self._skip_no_mx_domain(domain, domain_leads)
+
+        domain_limiter = self._domain_limiter()
+        for idx, lead, first_name, last_name, lead_domain, patterns in domain_leads:
+            record = await self._validate_lead_async(
+                client,
                 idx,
-                len(unique_patterns),
+                lead,
                 first_name,
                 last_name,
-                domain,
+                lead_domain,
+                patterns,
+                domain_limiter,
             )
+            self._write_record(record)
+        return len(domain_leads)
+
+    def _domain_limiter(self) -> TokenBucket:
+        """Rate limiter for checks against a single domain's mail server."""
+        # At most one check per VALIDATION_DELAY_SECONDS against this domain's
+        # mail server; time spent waiting on Reacher counts towards the gap
+        return TokenBucket(
+            1 / VALIDATION_DELAY_SECONDS if VALIDATION_DELAY_SECONDS > 0 else 0
+        )
 
-            # Validate patterns one at a time, stopping early when a validated email is found
-            best_email = None
-            best_status = None
-            best_result = None
-            patterns_tested = 0
-            patterns_validated = 0
+    def _write_record(self, record: Dict) -> None:
+        """Append one record to the output CSV and flush it to disk."""
+        with self._write_lock:
+            self._writer.writerow(record)
+            self._output.flush()
+
+    def _validate_lead(
+        self,
+        idx: int,
+        lead: Dict[str, Any],
+        first_name: str,
+        last_name: str,
+        domain: str,
+        patterns: List[Tuple[int, str]],
+        domain_limiter: TokenBucket,
+    ) -> Dict:
+        """Validate the generated email patterns for a single lead."""
+        priors, ordered = self._order_patterns(
+            idx, first_name, last_name, domain, patterns
+        )
 
-            for pattern_idx, pattern in enumerate(unique_patterns, 1):
-                patterns_tested = pattern_idx
+        # Validate patterns one at a time, stopping early when a validated email is found
+        search = _LeadSearch()
+        for pattern_idx, (template_id, pattern) in enumerate(ordered, 1):
+            logger.info("Validating %s/%s: %s", pattern_idx, len(ordered), pattern)
+            result = self._cached_validate(pattern, domain_limiter)
+            if search.add(pattern, result):
+                priors[template_id] += 1
                 logger.info(
-                    "Validating %s/%s: %s", pattern_idx, len(unique_patterns), pattern
+                    "Lead %s: Found safe email %s, stopping validation", idx, pattern
                 )
+                break
+
+        return self._finish_lead(idx, lead, first_name, last_name, domain, search)
+
+    async def _validate_lead_async(
+        self,
+        client: AsyncReacherClient,
+        idx: int,
+        lead: Dict[str, Any],
+        first_name: str,
+        last_name: str,
+        domain: str,
+        patterns: List[Tuple[int, str]],
+        domain_limiter: TokenBucket,
+    ) -> Dict:
+        """Async counterpart of _validate_lead()."""
+        priors, ordered = self._order_patterns(
+            idx, first_name, last_name, domain, patterns
+        )
 
-                result = self.reacher_client.validate_email(pattern)
-                result["email"] = pattern
-
-                status = result.get("is_reachable", "invalid")
-                # Parse nested structure: smtp.is_deliverable indicates SMTP validation success
-                smtp_data = result.get("smtp", {})
-                is_reachable_smtp = smtp_data.get("is_deliverable", False)
-
-                # Track validated patterns
-                if is_reachable_smtp:
-                    patterns_validated += 1
-
-                # Skip invalid emails
-                if status == "invalid" or not is_reachable_smtp:
-                    # Rate limiting: wait between requests (except for the last one)
-                    if pattern_idx < len(unique_patterns):
-                        time.sleep(VALIDATION_DELAY_SECONDS)
-                    continue
-
-                # Found a valid email
-                if status == "safe":
-                    # "safe" is the best status - stop immediately
-                    best_email = pattern
-                    best_status = status
-                    best_result = result
-                    logger.info(
-                        "Lead %s: Found safe email %s, stopping validation",
-                        idx,
-                        pattern,
-                    )
-                    break
-                elif status == "risky" and best_status != "safe":
-                    # Store risky email but continue searching for a safe one
-                    if INCLUDE_RISKY:
-                        best_email = pattern
-                        best_status = status
-                        best_result = result
-                        # Continue searching for a safe email, but we have a risky fallback
-
-                # Rate limiting: wait between requests (except for the last one or if stopping)
-                if pattern_idx < len(unique_patterns):
-                    time.sleep(VALIDATION_DELAY_SECONDS)
-
-            # Build record with all validation details
-            record = {
-                "first_name": first_name,
-                "last_name": last_name,
-                "company_domain": domain,
-                "validated_email": best_email or "",
-                "validation_status": best_status or "none_found",
-                "is_reachable": best_result.get("is_reachable", "")
-                if best_result
-                else "",
-                "is_reachable_smtp": (
-                    best_result.get("smtp", {}).get("is_deliverable", False)
-                    if best_result
-                    else False
-                ),
-                "is_disposable": (
-                    best_result.get("misc", {}).get("is_disposable", False)
-                    if best_result
-                    else False
-                ),
-                "is_role_account": (
-                    best_result.get("misc", {}).get("is_role_account", False)
-                    if best_result
-                    else False
-                ),
-                "mx_records": (
-                    ", ".join(best_result.get("mx", {}).get("records", []))
-                    if best_result and best_result.get("mx", {}).get("records")
-                    else ""
-                ),
-                "patterns_tested": patterns_tested,
-                "patterns_validated": patterns_validated,
-            }
-
-            # Add any additional columns from the original lead
-            for col in leads_df.columns:
-                if col not in record:
-                    record[col] = lead.get(col, "")
-
-            validated_records.append(record)
-
-            logger.info(
-                "Lead %s: Found %s validated email (status=%s)",
-                idx,
-                best_email or "none",
-                best_status or "none",
-            )
+        search = _LeadSearch()
+        for pattern_idx, (template_id, pattern) in enumerate(ordered, 1):
+            logger.info("Validating %s/%s: %s", pattern_idx, len(ordered), pattern)
+            result = await self._cached_validate_async(client, pattern, domain_limiter)
+            if search.add(pattern, result):
+                priors[template_id] += 1
+                logger.info(
+                    "Lead %s: Found safe email %s, stopping validation", idx, pattern
+                )
+                break
 
-        return pd.DataFrame(validated_records)
+        return self._finish_lead(idx, lead, first_name, last_name, domain, search)
 
-    def _export_csv(self, df: pd.DataFrame) -> Path:
-        """Export validated emails to UTF-8 CSV with timestamped filename."""
-        output_file = OUTPUT_DIR / _timestamped_filename("validated_emails", "csv")
+    def _skip_no_mx_domain(self, domain: str, domain_leads: List[LeadTask]) -> int:
+        """Write records for leads at a domain that cannot receive mail."""
+        for idx, lead, first_name, last_name, lead_domain, _ in domain_leads:
+            logger.warning(
+                "Lead %s: No MX records for %s, skipping validation", idx, domain
+            )
+            self._write_record(
+                self._build_record(
+                    lead, first_name, last_name, lead_domain, best_status="no_mx_record"
+                )
+            )
+        return len(domain_leads)
+
+    def _order_patterns(
+        self,
+        idx: int,
+        first_name: str,
+        last_name: str,
+        domain: str,
+        patterns: List[Tuple[int, str]],
+    ) -> Tuple[Counter, List[Tuple[int, str]]]:
+        """Return the domain's pattern priors and the patterns in the order to try."""
+        # Try formats that already validated at this domain first (stable sort
+        # keeps the prevalence order for ties and unseen domains)
+        priors = self.pattern_priors.setdefault(domain.lower(), Counter())
+        ordered = sorted(patterns, key=lambda item: -priors[item[0]])
+
+        logger.info(
+            "Lead %s: Generated %s email patterns for %s %s @ %s",
+            idx,
+            len(ordered),
+            first_name,
+            last_name,
+            domain,
+        )
+        return priors, ordered
+
+    def _finish_lead(
+        self,
+        idx: int,
+        lead: Dict[str, Any],
+        first_name: str,
+        last_name: str,
+        domain: str,
+        search: _LeadSearch,
+    ) -> Dict:
+        """Log the outcome of a lead's search and build its output record."""
+        logger.info(
+            "Lead %s: Found %s validated email (status=%s)",
+            idx,
+            search.best_email or "none",
+            search.best_status or "none",
+        )
+        return self._build_record(
+            lead,
+            first_name,
+            last_name,
+            domain,
+            best_email=search.best_email,
+            best_status=search.best_status,
+            best_result=search.best_result,
+            patterns_tested=search.patterns_tested,
+            patterns_validated=search.patterns_validated,
+        )
 
-        # Prioritize key columns, then include any others
-        priority_columns = [
-            "first_name",
-            "last_name",
-            "company_domain",
-            "validated_email",
-            "validation_status",
-            "is_reachable",
-            "is_reachable_smtp",
-            "is_disposable",
-            "is_role_account",
-            "patterns_tested",
-            "patterns_validated",
+    def _build_record(
+        self,
+        lead: Dict[str, Any],
+        first_name: str,
+        last_name: str,
+        domain: str,
+        best_email: Optional[str] = None,
+        best_status: Optional[str] = None,
+        best_result: Optional[Dict] = None,
+        patterns_tested: int = 0,
+        patterns_validated: int = 0,
+    ) -> Dict:
+        """Build the output record for a lead with all validation details."""
+        record = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "company_domain": domain,
+            "validated_email": best_email or "",
+            "validation_status": best_status or "none_found",
+            "patterns_tested": patterns_tested,
+            "patterns_validated": patterns_validated,
+        }
+        record.update(_flatten_reacher_result(best_result))
+
+        # Carry over the lead's other columns; computed fields take precedence
+        return {**lead, **record}
+
+    def _output_columns(self, lead_columns: pd.Index) -> List[str]:
+        """Return output CSV columns: key columns first, then the lead's others."""
+        return list(self._PRIORITY_COLUMNS) + [
+            c for c in lead_columns if c not in self._PRIORITY_SET
         ]
 
-        # Get columns in priority order, then any remaining columns
-        columns = [c for c in priority_columns if c in df.columns]
-        remaining = [c for c in df.columns if c not in columns]
-        columns.extend(remaining)
-
-        df.to_csv(output_file, index=False, columns=columns, encoding="utf-8")
-        logger.info("Exported %s validated leads to %s", len(df), output_file)
-        return output_file
-
 
 def main() -> None:
     pipeline = EmailValidationPipeline()
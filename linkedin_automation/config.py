@@ -12,6 +12,9 @@ PROJECT_DIR = Path(__file__).parent
 # OpenOutreach API configuration
 API_BASE_URL = os.getenv("OPENOUTREACH_API_URL", "http://localhost:8000")
 API_KEY = os.getenv("OPENOUTREACH_API_KEY", "")
+OPENOUTREACH_HTTP2 = (
+    os.getenv("OPENOUTREACH_HTTP2", "false").lower() == "true"
+)  # Multiplex requests over one connection; needs `httpx[http2]`
 
 # Account configuration
 ACCOUNT_HANDLE = os.getenv("ACCOUNT_HANDLE", "")
@@ -20,6 +23,10 @@ ACCOUNT_PASSWORD = os.getenv("ACCOUNT_PASSWORD", "")  # LinkedIn password
 ACCOUNT_PROXY = os.getenv("ACCOUNT_PROXY", None)  # Optional proxy
 ACCOUNT_DAILY_CONNECTIONS = int(os.getenv("ACCOUNT_DAILY_CONNECTIONS", "50"))
 ACCOUNT_DAILY_MESSAGES = int(os.getenv("ACCOUNT_DAILY_MESSAGES", "20"))
+ACCOUNT_CACHE_TTL_S = float(os.getenv("ACCOUNT_CACHE_TTL_S", "3600"))  # Account lookup cache
+ACCOUNT_MARKER_TTL_S = float(
+    os.getenv("ACCOUNT_MARKER_TTL_S", "86400")
+)  # Skip the startup account check for this long after a confirmed one
 
 # Input/Output configuration (relative to project directory)
 INPUT_LEADS_CSV = str(PROJECT_DIR / "input" / "leads.csv")
@@ -29,5 +36,12 @@ OUTPUT_DIR = PROJECT_DIR / "output"
 PROFILE_VISIT_DURATION_S = float(os.getenv("PROFILE_VISIT_DURATION_S", "5.0"))
 PROFILE_VISIT_SCROLL_DEPTH = int(os.getenv("PROFILE_VISIT_SCROLL_DEPTH", "3"))
 RUN_POLL_INTERVAL_S = float(os.getenv("RUN_POLL_INTERVAL_S", "2.0"))
+RUN_POLL_MIN_INTERVAL_S = float(os.getenv("RUN_POLL_MIN_INTERVAL_S", "0.25"))  # First poll delay
 RUN_POLL_TIMEOUT_S = float(os.getenv("RUN_POLL_TIMEOUT_S", "300.0"))  # 5 minutes max per run
+LEAD_CONCURRENCY = int(os.getenv("LEAD_CONCURRENCY", "8"))  # Leads processed in parallel
+LEAD_RATE_PER_S = float(os.getenv("LEAD_RATE_PER_S", "1.0"))  # Lead starts/second; 0 = no limit
+LEADS_ASYNC = (
+    os.getenv("LEADS_ASYNC", "true").lower() == "true"
+)  # asyncio orchestration; "false" uses a thread pool
+LEADS_CHUNK_SIZE = int(os.getenv("LEADS_CHUNK_SIZE", "5000"))  # Rows read at a time
 
@@ -9,14 +9,23 @@ Campaign flow:
 Reads leads from input/leads.csv with columns: linkedin_url, note
 """
 
+import asyncio
+import csv
 import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
+import httpx
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import (
     ACCOUNT_HANDLE,
@@ -24,14 +33,22 @@ from .config import (
     ACCOUNT_PASSWORD,
     ACCOUNT_PROXY,
     ACCOUNT_DAILY_CONNECTIONS,
+    ACCOUNT_CACHE_TTL_S,
+    ACCOUNT_MARKER_TTL_S,
     ACCOUNT_DAILY_MESSAGES,
     API_BASE_URL,
     API_KEY,
     INPUT_LEADS_CSV,
+    LEAD_CONCURRENCY,
+    LEAD_RATE_PER_S,
+    LEADS_ASYNC,
+    LEADS_CHUNK_SIZE,
+    OPENOUTREACH_HTTP2,
     OUTPUT_DIR,
     PROFILE_VISIT_DURATION_S,
     PROFILE_VISIT_SCROLL_DEPTH,
     RUN_POLL_INTERVAL_S,
+    RUN_POLL_MIN_INTERVAL_S,
     RUN_POLL_TIMEOUT_S,
 )
 
@@ -41,12 +58,114 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()],
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; run polling would flood the output
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Run statuses after which a run no longer changes
+_TERMINAL_STATUSES = ("completed", "failed")
+
+# Output CSV columns written first, ahead of any extra lead columns
+_PRIORITY_COLUMNS = (
+    "linkedin_url",
+    "note",
+    "profile_visit_status",
+    "profile_visit_error",
+    "profile_visit_run_id",
+    "connect_status",
+    "connect_error",
+    "connect_run_id",
+    "success",
+)
+_PRIORITY_SET = frozenset(_PRIORITY_COLUMNS)
+
+# Transient API errors, retried with exponential backoff (or Retry-After)
+_RETRY_STATUSES = (429, 502, 503, 504)
+# Errors where the server refused a request without acting on it, so a POST
+# can be re-sent without risk of creating a duplicate run
+_REFUSED_STATUSES = (429, 503)
+_MAX_RETRIES = 5
+_RETRY_BACKOFF_SECONDS = 0.5
+
+
+class _RunRetry(Retry):
+    """urllib3 Retry that also re-sends POSTs the server refused (429/503)."""
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method == "POST":
+            return status_code in _REFUSED_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _event_status(line: str) -> Optional[str]:
+    """Return the run status carried by a server-sent event line, if any."""
+    if not line.startswith("data:"):
+        return None  # Comments/keep-alives and other SSE fields
+    try:
+        event = orjson.loads(line[len("data:") :])
+    except ValueError:
+        return None
+    return event.get("status") if isinstance(event, dict) else None
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring a Retry-After header."""
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return _RETRY_BACKOFF_SECONDS * 2**attempt
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; acquire()
+    only sleeps when the bucket is empty, so time already spent waiting on
+    responses counts towards the rate. A non-positive rate disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.refill_rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Consume a token if one is available, else return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.refill_rate,
+            )
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.refill_rate
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        if self.refill_rate <= 0:
+            return
+        while (wait := self._take()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like acquire(), but yields to the event loop while waiting."""
+        if self.refill_rate <= 0:
+            return
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
 
 
 class OpenOutreachClient:
     """Client for OpenOutreach API server."""
 
-    def __init__(self, api_url: str, api_key: str) -> None:
+    def __init__(self, api_url: str, api_key: str, pool_size: int = 32) -> None:
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key
         self.headers = {
@@ -56,6 +175,40 @@ class OpenOutreachClient:
         if api_key:
             self.headers["X-API-Key"] = api_key
 
+        # Pooled keep-alive connections, so frequent run polling doesn't pay a
+        # new TCP/TLS handshake per request. GETs are retried on any transient
+        # error; POSTs only when refused, as a gateway error may come after the
+        # run was created.
+        retry = _RunRetry(
+            total=_MAX_RETRIES,
+            backoff_factor=_RETRY_BACKOFF_SECONDS,
+            status_forcelist=_RETRY_STATUSES,
+            respect_retry_after_header=True,
+        )
+        # Size the pool to the number of concurrent callers, so no connection
+        # is discarded after use.
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        # Whether the server streams run events; None until first tried
+        self._events_supported: Optional[bool] = None
+        # handle -> (fetched_at, account or None if not found)
+        self._account_cache: Dict[str, Tuple[float, Optional[Dict]]] = {}
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "OpenOutreachClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def create_run(
         self,
         handle: str,
@@ -88,41 +241,36 @@ class OpenOutreachClient:
             "tags": tags or {},
         }
 
-        try:
-            resp = requests.post(
-                endpoint, headers=self.headers, json=payload, timeout=30
-            )
-            resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.RequestException as err:
-            logger.error("API error creating run: %s", err)
-            raise
+        resp = self.session.post(endpoint, data=orjson.dumps(payload), timeout=30)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
     def get_run(self, run_id: str) -> Dict:
         """Get run status and results."""
         endpoint = f"{self.api_url}/api/v1/runs/{run_id}"
 
-        try:
-            resp = requests.get(endpoint, headers=self.headers, timeout=30)
-            resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.RequestException as err:
-            logger.error("API error getting run %s: %s", run_id, err)
-            raise
+        resp = self.session.get(endpoint, timeout=30)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
     def poll_run_until_complete(
         self,
         run_id: str,
         poll_interval: float = RUN_POLL_INTERVAL_S,
         timeout: float = RUN_POLL_TIMEOUT_S,
+        min_interval: float = RUN_POLL_MIN_INTERVAL_S,
     ) -> Dict:
         """
         Poll run status until it reaches a terminal state (completed/failed).
 
+        Polls quickly at first so short runs return promptly, then backs off
+        exponentially (with jitter) up to `poll_interval` for long runs.
+
         Args:
             run_id: Run ID to poll
-            poll_interval: Seconds between polls
+            poll_interval: Maximum seconds between polls
             timeout: Maximum seconds to wait
+            min_interval: Seconds before the second poll
 
         Returns:
             Final run status dict
@@ -132,6 +280,7 @@ class OpenOutreachClient:
         """
         start_time = time.time()
         last_status = None
+        interval = min(min_interval, poll_interval)
 
         while True:
             elapsed = time.time() - start_time
@@ -150,25 +299,105 @@ class OpenOutreachClient:
                 last_status = status
 
             # Terminal states
-            if status in ["completed", "failed"]:
+            if status in _TERMINAL_STATUSES:
                 return run_data
 
-            # Wait before next poll
-            time.sleep(poll_interval)
+            # Wait before next poll; jitter keeps concurrent pollers apart
+            time.sleep(interval + random.uniform(0, interval * 0.1))
+            interval = min(interval * 1.5, poll_interval)
 
-    def get_account(self, handle: str) -> Optional[Dict]:
-        """Get account by handle. Returns None if not found."""
-        endpoint = f"{self.api_url}/api/v1/accounts/{handle}"
+    def stream_run_until_complete(
+        self, run_id: str, timeout: float = RUN_POLL_TIMEOUT_S
+    ) -> Optional[Dict]:
+        """
+        Follow a run's server-sent events until it reaches a terminal state.
+
+        One streaming request replaces repeated polling. Returns the final run
+        status dict, or None if the server has no events endpoint (404/405) or
+        the stream ends or fails early, in which case the caller should poll.
+
+        Raises:
+            TimeoutError: If run doesn't complete within timeout
+        """
+        endpoint = f"{self.api_url}/api/v1/runs/{run_id}/events"
+        start_time = time.time()
+        last_status = None
 
         try:
-            resp = requests.get(endpoint, headers=self.headers, timeout=30)
-            if resp.status_code == 404:
-                return None
-            resp.raise_for_status()
-            return resp.json()
+            with self.session.get(
+                endpoint,
+                headers={"Accept": "text/event-stream"},
+                stream=True,
+                timeout=(10, timeout),
+            ) as resp:
+                if resp.status_code in (404, 405):
+                    logger.info("Run events not supported by API, polling instead")
+                    self._events_supported = False
+                    return None
+                resp.raise_for_status()
+                self._events_supported = True
+
+                for raw_line in resp.iter_lines():
+                    if time.time() - start_time > timeout:
+                        raise TimeoutError(
+                            f"Run {run_id} did not complete within {timeout}s"
+                        )
+                    status = _event_status(raw_line.decode("utf-8"))
+                    if status is None:
+                        continue
+                    if status != last_status:
+                        logger.info(
+                            "Run %s: %s → %s", run_id, last_status or "initial", status
+                        )
+                        last_status = status
+                    if status in _TERMINAL_STATUSES:
+                        break
         except requests.exceptions.RequestException as err:
-            logger.error("API error getting account %s: %s", handle, err)
-            raise
+            logger.warning("Run %s: events stream failed: %s", run_id, err)
+            return None
+
+        if last_status not in _TERMINAL_STATUSES:
+            return None
+        # Events may carry only the status; fetch the full run once the stream
+        # has released its connection
+        return self.get_run(run_id)
+
+    def wait_for_run(self, run_id: str, timeout: float = RUN_POLL_TIMEOUT_S) -> Dict:
+        """
+        Wait for a run to reach a terminal state.
+
+        Uses the run events stream when the server supports it, otherwise
+        falls back to poll_run_until_complete().
+        """
+        if self._events_supported is not False:
+            run_data = self.stream_run_until_complete(run_id, timeout)
+            if run_data is not None:
+                return run_data
+        return self.poll_run_until_complete(run_id, timeout=timeout)
+
+    def get_account(self, handle: str) -> Optional[Dict]:
+        """
+        Get account by handle. Returns None if not found.
+
+        Lookups (including "not found") are cached for ACCOUNT_CACHE_TTL_S.
+        """
+        cached = self._account_cache.get(handle)
+        if cached and time.monotonic() - cached[0] < ACCOUNT_CACHE_TTL_S:
+            return cached[1]
+
+        account = self._fetch_account(handle)
+        self._account_cache[handle] = (time.monotonic(), account)
+        return account
+
+    def _fetch_account(self, handle: str) -> Optional[Dict]:
+        """Get account by handle from the API. Returns None if not found."""
+        endpoint = f"{self.api_url}/api/v1/accounts/{handle}"
+
+        resp = self.session.get(endpoint, timeout=30)
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
     def account_exists(self, handle: str) -> bool:
         """Check if account exists."""
@@ -213,15 +442,308 @@ class OpenOutreachClient:
             "booking_link": booking_link,
         }
 
+        resp = self.session.post(endpoint, data=orjson.dumps(payload), timeout=30)
+        resp.raise_for_status()
+        account = orjson.loads(resp.content)
+        # Replace any cached "not found" for this handle
+        self._account_cache[handle] = (time.monotonic(), account)
+        return account
+
+
+class AsyncOpenOutreachClient:
+    """
+    asyncio client for OpenOutreach run operations.
+
+    Mirrors the run methods of OpenOutreachClient so many leads can wait on
+    their runs from one event loop, sharing a keep-alive connection pool. With
+    `http2=True` (needs the h2 package) all requests and event streams are
+    multiplexed over a single connection. Use as an async context manager so
+    the pool is closed with the event loop.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        max_connections: int = 64,
+        http2: bool = False,
+    ) -> None:
+        self.api_url = api_url.rstrip("/")
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["X-API-Key"] = api_key
+
+        self.client = httpx.AsyncClient(
+            base_url=self.api_url,
+            headers=self.headers,
+            timeout=30,
+            # The transport retries failed connects; _request() retries statuses
+            transport=httpx.AsyncHTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                retries=_MAX_RETRIES,
+            ),
+        )
+        # Whether the server streams run events; None until first tried
+        self._events_supported: Optional[bool] = None
+        # Whether the server returns several runs per request; None until tried
+        self._batch_supported: Optional[bool] = None
+        # Runs awaiting the shared batched poller: run_id -> final run future
+        self._pending_runs: Dict[str, asyncio.Future] = {}
+        self._poll_interval = RUN_POLL_MIN_INTERVAL_S
+        self._poller: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncOpenOutreachClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+        await self.client.aclose()
+
+    async def create_run(
+        self,
+        handle: str,
+        touchpoint_type: str,
+        touchpoint_data: Dict,
+        tags: Optional[Dict] = None,
+        dry_run: bool = False,
+    ) -> Dict:
+        """Create a new run via API (see OpenOutreachClient.create_run)."""
+        payload = {
+            "handle": handle,
+            "touchpoint": {
+                "type": touchpoint_type,
+                **touchpoint_data,
+            },
+            "dry_run": dry_run,
+            "tags": tags or {},
+        }
+
+        resp = await self._request(
+            "POST", "/api/v1/runs", content=orjson.dumps(payload)
+        )
+        return orjson.loads(resp.content)
+
+    async def get_run(self, run_id: str) -> Dict:
+        """Get run status and results."""
+        resp = await self._request("GET", f"/api/v1/runs/{run_id}")
+        return orjson.loads(resp.content)
+
+    async def get_runs(self, run_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get the status of several runs in one request.
+
+        Returns run dicts keyed by run_id. Runs the server doesn't report are
+        left out.
+        """
+        resp = await self._request(
+            "GET", "/api/v1/runs", params={"ids": ",".join(run_ids)}
+        )
+        data = orjson.loads(resp.content)
+        runs = data.get("runs", []) if isinstance(data, dict) else data
+        wanted = set(run_ids)
+        return {run["run_id"]: run for run in runs if run.get("run_id") in wanted}
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying with the same policy as the sync client."""
+        retry_statuses = _REFUSED_STATUSES if method == "POST" else _RETRY_STATUSES
+        for attempt in range(_MAX_RETRIES + 1):
+            resp = await self.client.request(method, url, **kwargs)
+            if resp.status_code not in retry_statuses or attempt == _MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(resp, attempt))
+        resp.raise_for_status()
+        return resp
+
+    async def poll_many_until_complete(
+        self, run_id: str, timeout: float = RUN_POLL_TIMEOUT_S
+    ) -> Optional[Dict]:
+        """
+        Wait for a run through the shared batched poller.
+
+        Every run waited on this way is polled with a single get_runs() request
+        per tick, and each caller wakes only when its own run finishes.
+        Returns the final run status dict, or None if the server has no usable
+        batch endpoint (404/405, an unreadable body, or requested runs left out
+        of the response), in which case the caller should poll the run alone.
+
+        Raises:
+            TimeoutError: If run doesn't complete within timeout
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_runs[run_id] = future
+        # A new run may finish quickly: poll at the fastest rate again
+        self._poll_interval = RUN_POLL_MIN_INTERVAL_S
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll_many())
+
         try:
-            resp = requests.post(
-                endpoint, headers=self.headers, json=payload, timeout=30
-            )
-            resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.RequestException as err:
-            logger.error("API error creating account: %s", err)
-            raise
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            raise TimeoutError(
+                f"Run {run_id} did not complete within {timeout}s"
+            ) from None
+        finally:
+            self._pending_runs.pop(run_id, None)
+
+    async def _poll_many(self) -> None:
+        """Poll pending runs in batches until none are left."""
+        last_statuses: Dict[str, Optional[str]] = {}
+
+        while self._pending_runs:
+            run_ids = list(self._pending_runs)
+            try:
+                runs = await self.get_runs(run_ids)
+            except httpx.HTTPError as err:
+                if isinstance(err, httpx.HTTPStatusError) and (
+                    err.response.status_code in (404, 405)
+                ):
+                    logger.info("Batched run status not supported by API")
+                    self._fall_back_to_single_polls()
+                    return
+                # Likely transient (timeout, 5xx after retries): try again next
+                # tick; each waiter still gives up at its own timeout
+                logger.warning("Batched run status poll failed: %s", err)
+                runs = {}
+            except (ValueError, KeyError, TypeError, AttributeError) as err:
+                logger.warning("Unreadable batched run status (%s)", err)
+                self._fall_back_to_single_polls()
+                return
+            else:
+                if len(runs) < len(run_ids):
+                    # A server that serves /api/v1/runs as a plain list ignores ?ids=
+                    logger.info("Batched run status omitted requested runs")
+                    self._fall_back_to_single_polls()
+                    return
+                self._batch_supported = True
+
+            for run_id, run_data in runs.items():
+                status = run_data.get("status")
+                last_status = last_statuses.get(run_id)
+                if status != last_status:
+                    logger.info(
+                        "Run %s: %s → %s", run_id, last_status or "initial", status
+                    )
+                    last_statuses[run_id] = status
+
+                if status in _TERMINAL_STATUSES:
+                    last_statuses.pop(run_id, None)
+                    future = self._pending_runs.pop(run_id, None)
+                    if future is not None and not future.done():
+                        future.set_result(run_data)
+
+            interval = self._poll_interval
+            await asyncio.sleep(interval + random.uniform(0, interval * 0.1))
+            self._poll_interval = min(self._poll_interval * 1.5, RUN_POLL_INTERVAL_S)
+
+    def _fall_back_to_single_polls(self) -> None:
+        """Stop batching and wake every waiter to poll its run alone."""
+        self._batch_supported = False
+        for future in self._pending_runs.values():
+            if not future.done():
+                future.set_result(None)
+
+    async def poll_run_until_complete(
+        self,
+        run_id: str,
+        poll_interval: float = RUN_POLL_INTERVAL_S,
+        timeout: float = RUN_POLL_TIMEOUT_S,
+        min_interval: float = RUN_POLL_MIN_INTERVAL_S,
+    ) -> Dict:
+        """Poll run status until terminal (see OpenOutreachClient)."""
+        start_time = time.time()
+        last_status = None
+        interval = min(min_interval, poll_interval)
+
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(f"Run {run_id} did not complete within {timeout}s")
+
+            run_data = await self.get_run(run_id)
+            status = run_data.get("status")
+
+            if status != last_status:
+                logger.info(
+                    "Run %s: %s → %s",
+                    run_data.get("run_id"),
+                    last_status or "initial",
+                    status,
+                )
+                last_status = status
+
+            if status in _TERMINAL_STATUSES:
+                return run_data
+
+            await asyncio.sleep(interval + random.uniform(0, interval * 0.1))
+            interval = min(interval * 1.5, poll_interval)
+
+    async def stream_run_until_complete(
+        self, run_id: str, timeout: float = RUN_POLL_TIMEOUT_S
+    ) -> Optional[Dict]:
+        """Follow a run's events until terminal (see OpenOutreachClient)."""
+        start_time = time.time()
+        last_status = None
+
+        try:
+            async with self.client.stream(
+                "GET",
+                f"/api/v1/runs/{run_id}/events",
+                headers={"Accept": "text/event-stream"},
+                timeout=httpx.Timeout(timeout, connect=10),
+            ) as resp:
+                if resp.status_code in (404, 405):
+                    logger.info("Run events not supported by API, polling instead")
+                    self._events_supported = False
+                    return None
+                resp.raise_for_status()
+                self._events_supported = True
+
+                async for line in resp.aiter_lines():
+                    if time.time() - start_time > timeout:
+                        raise TimeoutError(
+                            f"Run {run_id} did not complete within {timeout}s"
+                        )
+                    status = _event_status(line)
+                    if status is None:
+                        continue
+                    if status != last_status:
+                        logger.info(
+                            "Run %s: %s → %s", run_id, last_status or "initial", status
+                        )
+                        last_status = status
+                    if status in _TERMINAL_STATUSES:
+                        break
+        except httpx.HTTPError as err:
+            logger.warning("Run %s: events stream failed: %s", run_id, err)
+            return None
+
+        if last_status not in _TERMINAL_STATUSES:
+            return None
+        return await self.get_run(run_id)
+
+    async def wait_for_run(
+        self, run_id: str, timeout: float = RUN_POLL_TIMEOUT_S
+    ) -> Dict:
+        """
+        Wait for a run to reach a terminal state.
+
+        Uses the run events stream when the server supports it, then the
+        batched poller, and finally polls the run on its own.
+        """
+        if self._events_supported is not False:
+            run_data = await self.stream_run_until_complete(run_id, timeout)
+            if run_data is not None:
+                return run_data
+        if self._batch_supported is not False:
+            run_data = await self.poll_many_until_complete(run_id, timeout)
+            if run_data is not None:
+                return run_data
+        return await self.poll_run_until_complete(run_id, timeout=timeout)
 
 
 class LinkedInAutomationPipeline:
@@ -236,22 +758,51 @@ class LinkedInAutomationPipeline:
             raise ValueError("ACCOUNT_PASSWORD environment variable is required")
 
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        self.client = OpenOutreachClient(API_BASE_URL, API_KEY)
+        # Leads in flight at once; never more than the daily connection quota
+        self.concurrency = max(1, min(LEAD_CONCURRENCY, ACCOUNT_DAILY_CONNECTIONS))
+        self.client = OpenOutreachClient(
+            API_BASE_URL, API_KEY, pool_size=self.concurrency
+        )
+        # Paces lead starts; the first `concurrency` leads may start at once
+        self.rate_limiter = TokenBucket(LEAD_RATE_PER_S, capacity=self.concurrency)
         self.account_handle = ACCOUNT_HANDLE
         self.account_username = ACCOUNT_USERNAME
         self.account_password = ACCOUNT_PASSWORD
         self.account_proxy = ACCOUNT_PROXY
         self.account_daily_connections = ACCOUNT_DAILY_CONNECTIONS
         self.account_daily_messages = ACCOUNT_DAILY_MESSAGES
+        # Output CSV, opened by run(); results are written as leads finish
+        self._output: Optional[IO[str]] = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._write_lock = threading.Lock()
+        # Present while the account is known to exist (see _ensure_account_exists)
+        self._account_marker = OUTPUT_DIR / f".account_{self.account_handle}.exists"
 
     def _ensure_account_exists(self) -> None:
-        """Check if account exists, create if it doesn't."""
+        """
+        Check if account exists, create if it doesn't.
+
+        A marker file records a confirmed account, so runs within
+        ACCOUNT_MARKER_TTL_S of the last check skip the API lookup.
+        """
+        marker = self._account_marker
+        if (
+            marker.exists()
+            and time.time() - marker.stat().st_mtime < ACCOUNT_MARKER_TTL_S
+        ):
+            logger.info(
+                "Account '%s' confirmed by a recent run, skipping check",
+                self.account_handle,
+            )
+            return
+
         logger.info("Checking if account '%s' exists...", self.account_handle)
 
         if self.client.account_exists(self.account_handle):
             logger.info(
                 "Account '%s' already exists, skipping creation", self.account_handle
             )
+            marker.touch()
             return
 
         logger.info(
@@ -273,6 +824,7 @@ class LinkedInAutomationPipeline:
             account["daily_connections"],
             account["daily_messages"],
         )
+        marker.touch()
 
     def run(self) -> None:
         """Execute the pipeline."""
@@ -280,254 +832,403 @@ class LinkedInAutomationPipeline:
         logger.info("Account handle: %s", self.account_handle)
         logger.info("API URL: %s", API_BASE_URL)
 
-        # Ensure account exists before processing leads
-        self._ensure_account_exists()
-
-        leads_df = self._load_leads()
-        results_df = self._process_leads(leads_df)
-        self._export_csv(results_df)
-        logger.info("=== Pipeline complete. Processed %s leads ===", len(results_df))
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = OUTPUT_DIR / f"campaign_results_{timestamp}.csv"
+        total_processed = 0
+        try:
+            # Ensure account exists before processing leads
+            self._ensure_account_exists()
+
+            with output_file.open("w", newline="", encoding="utf-8") as f:
+                self._output = f
+                for leads_df in self._load_leads():
+                    if self._writer is None:
+                        self._writer = csv.DictWriter(
+                            f,
+                            fieldnames=self._output_columns(leads_df.columns),
+                            extrasaction="ignore",
+                        )
+                        self._writer.writeheader()
+                    total_processed += self._process_leads(leads_df)
+        finally:
+            self.client.close()
+        logger.info("Exported %s results to %s", total_processed, output_file)
+        logger.info("=== Pipeline complete. Processed %s leads ===", total_processed)
+
+    def _load_leads(self) -> Iterator[pd.DataFrame]:
+        """
+        Stream the input leads CSV in chunks of LEADS_CHUNK_SIZE rows.
 
-    def _load_leads(self) -> pd.DataFrame:
-        """Load the input leads CSV."""
+        Each chunk is processed and written out before the next is parsed, so
+        memory stays flat regardless of file size.
+        """
         if not Path(INPUT_LEADS_CSV).exists():
             raise FileNotFoundError(
                 f"Lead file not found at {INPUT_LEADS_CSV}. "
                 "Create input/leads.csv with columns: linkedin_url, note"
             )
 
-        df = pd.read_csv(INPUT_LEADS_CSV)
+        # Check the header before parsing the whole file
+        header = pd.read_csv(INPUT_LEADS_CSV, nrows=0)
         required_cols = {"linkedin_url", "note"}
-        missing = required_cols - set(df.columns)
+        missing = required_cols - set(header.columns)
         if missing:
             raise ValueError(
                 f"Missing required columns in leads CSV: {sorted(missing)}. "
                 "Required: linkedin_url, note"
             )
 
-        logger.info("Loaded leads CSV with %s rows.", len(df))
-        return df
-
-    def _process_leads(self, leads_df: pd.DataFrame) -> pd.DataFrame:
+        # Required columns are free text: skip type inference for them
+        with pd.read_csv(
+            INPUT_LEADS_CSV,
+            dtype={col: "string" for col in required_cols},
+            engine="c",
+            chunksize=LEADS_CHUNK_SIZE,
+        ) as reader:
+            for chunk in reader:
+                if chunk.empty:
+                    logger.info("Loaded no leads from CSV.")
+                else:
+                    logger.info(
+                        "Loaded leads %s-%s from CSV.",
+                        chunk.index[0] + 1,
+                        chunk.index[-1] + 1,
+                    )
+                yield chunk
+
+    def _process_leads(self, leads_df: pd.DataFrame) -> int:
         """
         Process each lead: visit profile, then send connection request.
 
-        Returns DataFrame with results for each lead.
+        Leads are processed concurrently, since each one mostly waits on the
+        API. Each result is written to the output CSV as soon as the lead
+        finishes. Returns the number of results written.
         """
-        results = []
-
-        for idx, lead in leads_df.iterrows():
-            linkedin_url = str(lead.get("linkedin_url", "")).strip()
-            note = str(lead.get("note", "")).strip()
-
-            if not linkedin_url:
-                logger.warning("Skipping lead %s: missing linkedin_url", idx)
-                results.append(
-                    {
-                        "linkedin_url": linkedin_url,
-                        "note": note,
-                        "profile_visit_status": "skipped",
-                        "profile_visit_error": "Missing linkedin_url",
-                        "connect_status": "skipped",
-                        "connect_error": "Missing linkedin_url",
-                        "success": False,
-                    }
+        # Validate all rows at once; only complete leads are iterated below
+        urls = leads_df["linkedin_url"].fillna("").astype(str).str.strip()
+        notes = leads_df["note"].fillna("").astype(str).str.strip()
+        # Missing optional values are written as empty cells
+        leads_df = leads_df.assign(linkedin_url=urls, note=notes).fillna("")
+        missing_url = urls.eq("")
+        missing_note = notes.eq("") & ~missing_url
+        valid_mask = ~(missing_url | missing_note)
+
+        skipped_df = self._skipped_results(leads_df, missing_url, missing_note)
+        with self._write_lock:
+            self._writer.writerows(skipped_df.to_dict("records"))
+        valid_df = leads_df[valid_mask]
+
+        logger.info(
+            "Processing %s leads, %s at a time", len(valid_df), self.concurrency
+        )
+        if LEADS_ASYNC:
+            asyncio.run(self._process_valid_leads_async(valid_df, self.concurrency))
+        else:
+            self._process_valid_leads(valid_df, self.concurrency)
+
+        return len(skipped_df) + len(valid_df)
+
+    def _process_valid_leads(self, valid_df: pd.DataFrame, max_workers: int) -> None:
+        """Process complete leads on a thread pool."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._process_and_write, idx, lead)
+                for idx, lead in self._iter_leads(valid_df)
+            ]
+            for future in futures:
+                future.result()
+
+    async def _process_valid_leads_async(
+        self, valid_df: pd.DataFrame, concurrency: int
+    ) -> None:
+        """Process complete leads concurrently on one event loop."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_and_write(idx: int, lead: Dict[str, Any]) -> None:
+            async with semaphore:
+                result = await self._process_one_lead_async(client, idx, lead)
+            self._write_result(result)
+
+        async with AsyncOpenOutreachClient(
+            API_BASE_URL, API_KEY, max_connections=concurrency, http2=OPENOUTREACH_HTTP2
+        ) as client:
+            await asyncio.gather(
+                *(
+                    process_and_write(idx, lead)
+                    for idx, lead in self._iter_leads(valid_df)
                 )
-                continue
-
-            if not note:
-                logger.warning("Skipping lead %s: missing note", idx)
-                results.append(
-                    {
-                        "linkedin_url": linkedin_url,
-                        "note": note,
-                        "profile_visit_status": "skipped",
-                        "profile_visit_error": "Missing note",
-                        "connect_status": "skipped",
-                        "connect_error": "Missing note",
-                        "success": False,
-                    }
+            )
+
+    def _iter_leads(
+        self, leads_df: pd.DataFrame
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (index, lead dict) pairs for each row."""
+        # itertuples avoids boxing each row as a Series; position 0 is the index
+        columns = list(leads_df.columns)
+        for row in leads_df.itertuples(index=True, name=None):
+            yield row[0], dict(zip(columns, row[1:]))
+
+    def _process_and_write(self, idx: int, lead: Dict[str, Any]) -> None:
+        """Process one lead and append its result to the output CSV."""
+        self._write_result(self._process_one_lead(idx, lead))
+
+    def _write_result(self, result: Dict) -> None:
+        """Append one result row to the output CSV."""
+        with self._write_lock:
+            self._writer.writerow(result)
+            self._output.flush()
+
+    def _skipped_results(
+        self,
+        leads_df: pd.DataFrame,
+        missing_url: pd.Series,
+        missing_note: pd.Series,
+    ) -> pd.DataFrame:
+        """Build result rows for leads missing a linkedin_url or note."""
+        for mask, field in ((missing_url, "linkedin_url"), (missing_note, "note")):
+            if mask.any():
+                logger.warning(
+                    "Skipping %s leads with missing %s", int(mask.sum()), field
                 )
-                continue
 
-            logger.info(
-                "Processing lead %s/%s: %s", idx + 1, len(leads_df), linkedin_url
+        skipped = leads_df[missing_url | missing_note]
+        error = pd.Series("Missing note", index=skipped.index).mask(
+            missing_url[skipped.index], "Missing linkedin_url"
+        )
+        return pd.DataFrame(
+            {
+                "linkedin_url": skipped["linkedin_url"],
+                "note": skipped["note"],
+                "profile_visit_status": "skipped",
+                "profile_visit_error": error,
+                "connect_status": "skipped",
+                "connect_error": error,
+                "success": False,
+            },
+            index=skipped.index,
+        )
+
+    def _process_one_lead(self, idx: int, lead: Dict[str, Any]) -> Dict:
+        """Visit a lead's profile, then send the connection request."""
+        self.rate_limiter.acquire()
+        linkedin_url = lead["linkedin_url"]
+        logger.info("Processing lead %s: %s", idx + 1, linkedin_url)
+        # Both touchpoints share the lead's tags
+        tags = self._lead_tags(idx)
+
+        # Step 1: Visit profile
+        profile_visit_result = self._run_touchpoint(
+            idx, "Profile visit", "profile_visit", self._profile_visit_data(lead), tags
+        )
+
+        # Step 2: Send connection request (only if profile visit succeeded)
+        connect_result = None
+        if profile_visit_result.get("status") == "completed":
+            connect_result = self._run_touchpoint(
+                idx, "Connection request", "connect", self._connect_data(lead), tags
             )
 
-            # Step 1: Visit profile
-            profile_visit_result = self._visit_profile(linkedin_url, idx)
-            profile_visit_status = profile_visit_result.get("status")
-            profile_visit_error = profile_visit_result.get("error")
+        return self._build_result(lead, profile_visit_result, connect_result)
 
-            # Step 2: Send connection request (only if profile visit succeeded)
-            if profile_visit_status == "completed":
-                connect_result = self._send_connection_request(linkedin_url, note, idx)
-                connect_status = connect_result.get("status")
-                connect_error = connect_result.get("error")
-            else:
-                logger.warning(
-                    "Skipping connection request for %s due to profile visit failure",
-                    linkedin_url,
-                )
-                connect_status = "skipped"
-                connect_error = "Profile visit failed"
-
-            # Build result record
-            result = {
-                "linkedin_url": linkedin_url,
-                "note": note,
-                "profile_visit_status": profile_visit_status,
-                "profile_visit_error": profile_visit_error or "",
-                "profile_visit_run_id": profile_visit_result.get("run_id", ""),
-                "connect_status": connect_status,
-                "connect_error": connect_error or "",
-                "connect_run_id": connect_result.get("run_id", "")
-                if profile_visit_status == "completed"
-                else "",
-                "success": (
-                    profile_visit_status == "completed"
-                    and connect_status == "completed"
-                ),
-            }
+    async def _process_one_lead_async(
+        self, client: AsyncOpenOutreachClient, idx: int, lead: Dict[str, Any]
+    ) -> Dict:
+        """Async version of _process_one_lead()."""
+        await self.rate_limiter.acquire_async()
+        linkedin_url = lead["linkedin_url"]
+        logger.info("Processing lead %s: %s", idx + 1, linkedin_url)
+        tags = self._lead_tags(idx)
+
+        profile_visit_result = await self._run_touchpoint_async(
+            client,
+            idx,
+            "Profile visit",
+            "profile_visit",
+            self._profile_visit_data(lead),
+            tags,
+        )
 
-            # Add any additional columns from the original lead
-            for col in leads_df.columns:
-                if col not in result:
-                    result[col] = lead.get(col, "")
+        connect_result = None
+        if profile_visit_result.get("status") == "completed":
+            connect_result = await self._run_touchpoint_async(
+                client,
+                idx,
+                "Connection request",
+                "connect",
+                self._connect_data(lead),
+                tags,
+            )
+
+        return self._build_result(lead, profile_visit_result, connect_result)
 
-            results.append(result)
+    def _lead_tags(self, lead_idx: int) -> Dict[str, str]:
+        """Tags attached to every run created for a lead."""
+        return {"campaign": "linkedin_automation", "lead_idx": str(lead_idx)}
 
-            # Rate limiting: small delay between leads
-            if idx < len(leads_df) - 1:
-                time.sleep(1.0)
+    def _profile_visit_data(self, lead: Dict[str, Any]) -> Dict:
+        """Touchpoint data for visiting a lead's profile."""
+        return {
+            "url": lead["linkedin_url"],
+            "duration_s": PROFILE_VISIT_DURATION_S,
+            "scroll_depth": PROFILE_VISIT_SCROLL_DEPTH,
+        }
 
-        return pd.DataFrame(results)
+    def _connect_data(self, lead: Dict[str, Any]) -> Dict:
+        """Touchpoint data for a connection request with personalized note."""
+        return {
+            "url": lead["linkedin_url"],
+            "note": lead["note"],
+        }
 
-    def _visit_profile(self, linkedin_url: str, lead_idx: int) -> Dict:
-        """Visit a LinkedIn profile."""
+    def _run_touchpoint(
+        self,
+        lead_idx: int,
+        label: str,
+        touchpoint_type: str,
+        touchpoint_data: Dict,
+        tags: Dict[str, str],
+    ) -> Dict:
+        """Create a touchpoint run for a lead and wait until it finishes."""
         logger.info(
-            "Lead %s: Creating profile visit run for %s", lead_idx, linkedin_url
+            "Lead %s: Creating %s run for %s",
+            lead_idx,
+            label.lower(),
+            touchpoint_data["url"],
         )
 
         try:
             run_response = self.client.create_run(
                 handle=self.account_handle,
-                touchpoint_type="profile_visit",
-                touchpoint_data={
-                    "url": linkedin_url,
-                    "duration_s": PROFILE_VISIT_DURATION_S,
-                    "scroll_depth": PROFILE_VISIT_SCROLL_DEPTH,
-                },
-                tags={"campaign": "linkedin_automation", "lead_idx": str(lead_idx)},
+                touchpoint_type=touchpoint_type,
+                touchpoint_data=touchpoint_data,
+                tags=tags,
             )
 
             run_id = run_response.get("run_id")
-            logger.info("Lead %s: Profile visit run created: %s", lead_idx, run_id)
+            logger.info("Lead %s: %s run created: %s", lead_idx, label, run_id)
 
-            # Poll until complete
-            final_run = self.client.poll_run_until_complete(run_id)
-
-            status = final_run.get("status")
-            if status == "completed":
-                logger.info("Lead %s: Profile visit completed successfully", lead_idx)
-            else:
-                error = final_run.get("error", "Unknown error")
-                logger.error("Lead %s: Profile visit failed: %s", lead_idx, error)
-
-            return {
-                "run_id": run_id,
-                "status": status,
-                "error": final_run.get("error"),
-                "result": final_run.get("result"),
-            }
+            # Wait until complete
+            final_run = self.client.wait_for_run(run_id)
+            return self._touchpoint_outcome(lead_idx, label, run_id, final_run)
 
         except Exception as e:
-            logger.error("Lead %s: Profile visit error: %s", lead_idx, e, exc_info=True)
-            return {
-                "run_id": "",
-                "status": "failed",
-                "error": str(e),
-                "result": None,
-            }
-
-    def _send_connection_request(
-        self, linkedin_url: str, note: str, lead_idx: int
+            return self._touchpoint_error(lead_idx, label, e)
+
+    async def _run_touchpoint_async(
+        self,
+        client: AsyncOpenOutreachClient,
+        lead_idx: int,
+        label: str,
+        touchpoint_type: str,
+        touchpoint_data: Dict,
+        tags: Dict[str, str],
     ) -> Dict:
-        """Send a connection request with personalized note."""
+        """Async version of _run_touchpoint()."""
         logger.info(
-            "Lead %s: Creating connection request run for %s", lead_idx, linkedin_url
+            "Lead %s: Creating %s run for %s",
+            lead_idx,
+            label.lower(),
+            touchpoint_data["url"],
         )
 
         try:
-            run_response = self.client.create_run(
+            run_response = await client.create_run(
                 handle=self.account_handle,
-                touchpoint_type="connect",
-                touchpoint_data={
-                    "url": linkedin_url,
-                    "note": note,
-                },
-                tags={"campaign": "linkedin_automation", "lead_idx": str(lead_idx)},
+                touchpoint_type=touchpoint_type,
+                touchpoint_data=touchpoint_data,
+                tags=tags,
             )
 
             run_id = run_response.get("run_id")
-            logger.info("Lead %s: Connection request run created: %s", lead_idx, run_id)
+            logger.info("Lead %s: %s run created: %s", lead_idx, label, run_id)
 
-            # Poll until complete
-            final_run = self.client.poll_run_until_complete(run_id)
+            final_run = await client.wait_for_run(run_id)
+            return self._touchpoint_outcome(lead_idx, label, run_id, final_run)
 
-            status = final_run.get("status")
-            if status == "completed":
-                logger.info(
-                    "Lead %s: Connection request completed successfully", lead_idx
-                )
-            else:
-                error = final_run.get("error", "Unknown error")
-                logger.error("Lead %s: Connection request failed: %s", lead_idx, error)
+        except Exception as e:
+            return self._touchpoint_error(lead_idx, label, e)
 
-            return {
-                "run_id": run_id,
-                "status": status,
-                "error": final_run.get("error"),
-                "result": final_run.get("result"),
-            }
+    def _touchpoint_outcome(
+        self, lead_idx: int, label: str, run_id: str, final_run: Dict
+    ) -> Dict:
+        """Log a finished run and summarize it."""
+        status = final_run.get("status")
+        if status == "completed":
+            logger.info("Lead %s: %s completed successfully", lead_idx, label)
+        else:
+            error = final_run.get("error", "Unknown error")
+            logger.error("Lead %s: %s failed: %s", lead_idx, label, error)
+
+        return {
+            "run_id": run_id,
+            "status": status,
+            "error": final_run.get("error"),
+            "result": final_run.get("result"),
+        }
 
-        except Exception as e:
-            logger.error(
-                "Lead %s: Connection request error: %s", lead_idx, e, exc_info=True
+    def _touchpoint_error(self, lead_idx: int, label: str, err: Exception) -> Dict:
+        """Log a touchpoint that raised and summarize it as failed."""
+        logger.error("Lead %s: %s error: %s", lead_idx, label, err, exc_info=err)
+        # A 404 may mean the account is gone: check it again next run
+        response = getattr(err, "response", None)
+        if getattr(response, "status_code", None) == 404:
+            self._account_marker.unlink(missing_ok=True)
+        return {
+            "run_id": "",
+            "status": "failed",
+            "error": str(err),
+            "result": None,
+        }
+
+    def _build_result(
+        self,
+        lead: Dict[str, Any],
+        profile_visit_result: Dict,
+        connect_result: Optional[Dict],
+    ) -> Dict:
+        """Build a lead's output row from its touchpoint outcomes."""
+        linkedin_url = lead["linkedin_url"]
+        profile_visit_status = profile_visit_result.get("status")
+
+        if connect_result is not None:
+            connect_status = connect_result.get("status")
+            connect_error = connect_result.get("error")
+            connect_run_id = connect_result.get("run_id", "")
+        else:
+            logger.warning(
+                "Skipping connection request for %s due to profile visit failure",
+                linkedin_url,
             )
-            return {
-                "run_id": "",
-                "status": "failed",
-                "error": str(e),
-                "result": None,
-            }
-
-    def _export_csv(self, df: pd.DataFrame) -> Path:
-        """Export results to UTF-8 CSV with timestamped filename."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = OUTPUT_DIR / f"campaign_results_{timestamp}.csv"
+            connect_status = "skipped"
+            connect_error = "Profile visit failed"
+            connect_run_id = ""
+
+        result = {
+            "linkedin_url": linkedin_url,
+            "note": lead["note"],
+            "profile_visit_status": profile_visit_status,
+            "profile_visit_error": profile_visit_result.get("error") or "",
+            "profile_visit_run_id": profile_visit_result.get("run_id", ""),
+            "connect_status": connect_status,
+            "connect_error": connect_error or "",
+            "connect_run_id": connect_run_id,
+            "success": (
+                profile_visit_status == "completed" and connect_status == "completed"
+            ),
+        }
 
-        # Prioritize key columns, then include any others
-        priority_columns = [
-            "linkedin_url",
-            "note",
-            "profile_visit_status",
-            "profile_visit_error",
-            "profile_visit_run_id",
-            "connect_status",
-            "connect_error",
-            "connect_run_id",
-            "success",
-        ]
+        # Add any additional columns from the original lead
+        for col, value in lead.items():
+            if col not in result:
+                result[col] = value
 
-        # Get columns in priority order, then any remaining columns
-        columns = [c for c in priority_columns if c in df.columns]
-        remaining = [c for c in df.columns if c not in columns]
-        columns.extend(remaining)
+        return result
 
-        df.to_csv(output_file, index=False, columns=columns, encoding="utf-8")
-        logger.info("Exported %s results to %s", len(df), output_file)
-        return output_file
+    def _output_columns(self, lead_columns: pd.Index) -> List[str]:
+        """Return output CSV columns: key columns first, then the lead's others."""
+        return list(_PRIORITY_COLUMNS) + [
+            c for c in lead_columns if c not in _PRIORITY_SET
+        ]
 
 
 def main() -> None:
@@ -19,13 +19,35 @@ COMPANY_DATASET_ID = "gd_l1vikfnt1wgvvqz95w"
 # OpenAI API configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-5.2")
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "20"))  # Requests in flight at once
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "5"))  # Prospects per request
+LLM_MAX_OUTPUT_TOKENS = int(
+    os.getenv("LLM_MAX_OUTPUT_TOKENS", "220")
+)  # Per message; ~160 words plus margin
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))  # Per request
+MAX_RPM = float(os.getenv("MAX_RPM", "500"))  # OpenAI requests/minute; 0 = no limit
+MAX_TPM = float(os.getenv("MAX_TPM", "500000"))  # OpenAI tokens/minute; 0 = no limit
+BATCH_API_POLL_SECONDS = float(
+    os.getenv("BATCH_API_POLL_SECONDS", "60")
+)  # Between status checks in --batch mode
 
 # Input/Output configuration (relative to project directory)
 INPUT_LEADS_CSV = str(PROJECT_DIR / "input" / "leads.csv")
 OUTPUT_DIR = PROJECT_DIR / "output"
 LOCAL_PROFILES_PATH = ""
+SCRAPE_CACHE_PATH = OUTPUT_DIR / ".cache" / "brightdata.sqlite"  # Scraped records
+MESSAGE_CACHE_PATH = OUTPUT_DIR / ".cache" / "messages.sqlite"  # Generated emails
+STATE_DIR = OUTPUT_DIR / ".state"  # Snapshots still building, for resuming a run
 USE_LOCAL_PROFILES = False
 
+# Cache settings
+SCRAPE_CACHE_TTL_SECONDS = int(
+    os.getenv("SCRAPE_CACHE_TTL_SECONDS", str(30 * 24 * 3600))
+)  # Re-scrape profiles and companies older than this
+
 # Polling settings
-POLL_INTERVAL_SECONDS = int(os.getenv("POLL_INTERVAL_SECONDS", "5"))
+POLL_INTERVAL_SECONDS = int(os.getenv("POLL_INTERVAL_SECONDS", "5"))  # Longest wait
+POLL_MIN_INTERVAL_SECONDS = float(
+    os.getenv("POLL_MIN_INTERVAL_SECONDS", "1.0")
+)  # First wait; grows 1.5x per poll
 POLL_TIMEOUT_SECONDS = int(os.getenv("POLL_TIMEOUT_SECONDS", "300"))
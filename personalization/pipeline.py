@@ -6,30 +6,54 @@ generate personalized cold emails with an LLM.
 Original post: https://sarthakmishra.com/blog/scaling-highly-personalized-outbound
 """
 
-import json
+import argparse
+import asyncio
+import hashlib
 import logging
+import re
+import sqlite3
+import threading
 import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Sequence, Union
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 
+import httpx
+import orjson
 import pandas as pd
 import requests
-from openai import APIError, OpenAI, RateLimitError
+from openai import APIError, AsyncOpenAI, BadRequestError, RateLimitError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import (
+    BATCH_API_POLL_SECONDS,
     BRIGHTDATA_API_KEY,
     BRIGHTDATA_SNAPSHOT_URL,
     BRIGHTDATA_TRIGGER_URL,
     COMPANY_DATASET_ID,
     INPUT_LEADS_CSV,
+    LLM_BATCH_SIZE,
+    LLM_CONCURRENCY,
+    LLM_MAX_OUTPUT_TOKENS,
     LLM_MODEL,
+    LLM_TIMEOUT_SECONDS,
     LOCAL_PROFILES_PATH,
+    MAX_RPM,
+    MAX_TPM,
+    MESSAGE_CACHE_PATH,
     OPENAI_API_KEY,
     OUTPUT_DIR,
     POLL_INTERVAL_SECONDS,
+    POLL_MIN_INTERVAL_SECONDS,
     POLL_TIMEOUT_SECONDS,
     PROFILE_DATASET_ID,
+    SCRAPE_CACHE_PATH,
+    SCRAPE_CACHE_TTL_SECONDS,
+    STATE_DIR,
     USE_LOCAL_PROFILES,
 )
 
@@ -39,6 +63,64 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()],
 )
 logger = logging.getLogger(__name__)
+# httpx logs every OpenAI request at INFO, which floods the log under concurrency
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Bright Data responses worth retrying, and those sent before a trigger was accepted
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_REFUSED_STATUSES = (429, 503)
+# OpenAI Batch API statuses after which a batch makes no more progress
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+_PENDING_SNAPSHOT_MAX_AGE_S = 24 * 3600  # Older pending snapshots are re-triggered
+_EXPORT_CHUNK_ROWS = 10_000  # Rows formatted per write when exporting the CSV
+# Lead columns the merged frame is built from
+_MERGED_LEAD_COLUMNS = (
+    "email",
+    "first_name",
+    "last_name",
+    "title",
+    "company",
+    "about",
+    "profile_url",
+    "company_url",
+    "profile_key",
+    "company_key",
+)
+# Characters of each free-text field kept for the prompt, to bound input tokens
+_FIELD_LIMITS = {"about": 600, "company_about": 400, "education": 200}
+# Scheme and host of a LinkedIn URL, including regional subdomains and no scheme
+_LINKEDIN_HOST = re.compile(
+    r"^(?:https?://)?(?:[\w-]+\.)*linkedin\.com(?=/|$)", re.IGNORECASE
+)
+
+# Instructions shared by every prompt; prospect details go between the two parts
+_PROMPT_INTRO = (
+    "You are a sales outreach specialist. Craft a concise, highly personalized cold email "
+    "that feels written just for this person. Limit to 140-160 words, avoid fluff, and make one clear CTA.\n\n"
+    "Use the data below thoughtfully—reference only what is relevant and authentic. If a field is empty, just skip it.\n"
+)
+_PROMPT_GUIDELINES = (
+    "Product: [YOUR_PRODUCT_DESCRIPTION_HERE]\n\n"
+    "Structure:\n"
+    "1) One-line opener that shows you've actually read their background (title, location, education, or company mission—pick the best hook).\n"
+    "2) One-sentence bridge linking their context to your product's specific value (be concrete: metrics, outcomes, or workflow saved).\n"
+    "3) One short bullet or micro-example that proves the benefit (no jargon; relevant to media/tech audiences if applicable).\n"
+    "4) Close with a single, low-friction CTA (e.g., 10-minute intro this week) and offer to share a tailored example.\n"
+    "Keep tone warm, professional, and direct."
+)
+_PROSPECT_TEMPLATE = (
+    "- Name: {first_name} {last_name}\n"
+    "- Title: {title}\n"
+    "- Location: {location}\n"
+    "- Education: {education}\n"
+    "- About/Bio: {about}\n"
+    "- Company: {company}\n"
+    "- Company about: {company_about}\n"
+    "- Company industry: {company_industry}\n"
+    "- Company size: {company_size}\n"
+    "- Company website: {company_website}"
+)
+PROMPT_TEMPLATE = _PROMPT_INTRO + _PROSPECT_TEMPLATE + "\n\n" + _PROMPT_GUIDELINES
 
 
 def _timestamped_filename(prefix: str, suffix: str) -> str:
@@ -47,45 +129,118 @@ def _timestamped_filename(prefix: str, suffix: str) -> str:
     return f"{prefix}_{stamp}.{suffix}"
 
 
+def _canonical_linkedin_url(url: str) -> str:
+    """
+    Return a LinkedIn URL in the form submitted to Bright Data.
+
+    Any linkedin.com host (regional subdomains, no "www.", no scheme) becomes
+    `https://www.linkedin.com`, and the query, fragment and trailing slash are
+    dropped. The path keeps its case, so the URL still resolves.
+    """
+    url = url.strip().split("#")[0].split("?")[0].rstrip("/")
+    return _LINKEDIN_HOST.sub("https://www.linkedin.com", url)
+
+
+def _normalize_linkedin_url(url: str) -> str:
+    """
+    Return the key a LinkedIn URL is deduplicated, cached and joined on.
+
+    Variants such as `http://uk.linkedin.com/in/Foo/?trk=x` and
+    `linkedin.com/in/foo` share one key. Only for matching: Bright Data is
+    sent the _canonical_linkedin_url() form.
+    """
+    return _canonical_linkedin_url(url).lower()
+
+
+def _dedupe_urls(urls: pd.Series, keys: pd.Series) -> List[str]:
+    """
+    Return one URL for each distinct non-empty key, the first in `urls`.
+
+    Bright Data bills per submitted URL, so each one is sent once.
+    """
+    first = ~keys.duplicated() & (keys != "")
+    return urls[first].tolist()
+
+
+def _urls_hash(urls: List[str]) -> str:
+    """Return an order-independent fingerprint of a list of URLs."""
+    return hashlib.sha256("\n".join(sorted(urls)).encode()).hexdigest()
+
+
+def _pending_path(dataset_id: str) -> Path:
+    """Return the state file recording a dataset's in-progress snapshot."""
+    return STATE_DIR / f"pending_{dataset_id}.json"
+
+
+def _record_url(record: Dict) -> str:
+    """Return the URL a Bright Data record was scraped from."""
+    return record.get("url") or record.get("profile_url") or record.get("input_url")
+
+
+class _TriggerRetry(Retry):
+    """urllib3 Retry that also re-sends trigger POSTs Bright Data refused (429/503)."""
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method == "POST":
+            return status_code in _REFUSED_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
 class BrightDataClient:
     """Thin wrapper around Bright Data Scrapers Library trigger + snapshot APIs."""
 
-    def __init__(self, api_key: str, dataset_id: str) -> None:
+    def __init__(self, api_key: str) -> None:
         if not api_key:
             raise ValueError(
                 "BRIGHTDATA_API_KEY is required to scrape LinkedIn profiles."
             )
-        if not dataset_id:
-            raise ValueError("Bright Data dataset_id is required for scraping.")
 
         self.api_key = api_key
-        self.dataset_id = dataset_id
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip",
         }
 
-    def submit(self, urls: Sequence[str]) -> Union[List[Dict], str]:
+        # Keep-alive connections, so each snapshot poll doesn't pay a new TLS
+        # handshake. Polls are retried on any transient error; triggers only
+        # when refused, as a gateway error may come after the scrape started.
+        retry = _TriggerRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+
+    def submit(self, dataset_id: str, urls: Sequence[str]) -> Union[List[Dict], str]:
         """
-        Submit LinkedIn profile URLs via the Scrapers Library trigger API.
+        Submit LinkedIn URLs to a dataset via the Scrapers Library trigger API.
         Returns either results (if synchronous) or a snapshot_id (if async).
         """
+        if not dataset_id:
+            raise ValueError("Bright Data dataset_id is required for scraping.")
         params = {
-            "dataset_id": self.dataset_id,
+            "dataset_id": dataset_id,
             "include_errors": "true",
             "format": "json",
         }
         payload = [{"url": url} for url in urls]
 
-        resp = requests.post(
+        resp = self.session.post(
             BRIGHTDATA_TRIGGER_URL,
-            headers=self.headers,
             params=params,
-            json=payload,
+            data=orjson.dumps(payload),
             timeout=60,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         # The API can respond synchronously with data (list) or with snapshot metadata (dict)
         if isinstance(data, list):
@@ -101,61 +256,176 @@ class BrightDataClient:
         return snapshot_id
 
     def poll_results(self, snapshot_id: str) -> List[Dict]:
-        """Poll snapshots until results are ready or timeout."""
+        """
+        Poll snapshots until results are ready or timeout.
+
+        The wait between polls starts at POLL_MIN_INTERVAL_SECONDS and grows
+        1.5x per poll up to POLL_INTERVAL_SECONDS, unless Bright Data asks for
+        a specific delay with Retry-After.
+        """
         start = time.time()
+        interval = min(POLL_MIN_INTERVAL_SECONDS, POLL_INTERVAL_SECONDS)
         # Web Scraper API: poll the snapshot download endpoint
         # Returns 202 while building, 200 when ready
         snapshot_url = f"{BRIGHTDATA_SNAPSHOT_URL}/{snapshot_id}"
         params = {"format": "json"}
 
         while True:
-            resp = requests.get(
+            resp = self.session.get(
                 snapshot_url,
-                headers=self.headers,
                 params=params,
                 timeout=60,
             )
 
             # HTTP 202: snapshot still building
             if resp.status_code == 202:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 status = data.get("status", "building")
                 elapsed = time.time() - start
                 if elapsed > POLL_TIMEOUT_SECONDS:
                     raise TimeoutError(
                         f"Bright Data polling timed out after {POLL_TIMEOUT_SECONDS}s; last status={status}"
                     )
+                retry_after = resp.headers.get("Retry-After", "")
+                wait = float(retry_after) if retry_after.isdigit() else interval
                 logger.info(
-                    "Waiting for Bright Data results... status=%s elapsed=%.1fs",
+                    "Waiting for Bright Data results... snapshot_id=%s status=%s "
+                    "elapsed=%.1fs next_poll=%.1fs",
+                    snapshot_id,
                     status,
                     elapsed,
+                    wait,
                 )
-                time.sleep(POLL_INTERVAL_SECONDS)
+                time.sleep(wait)
+                interval = min(interval * 1.5, POLL_INTERVAL_SECONDS)
                 continue
 
             # HTTP 200: snapshot ready, data returned
             resp.raise_for_status()
-            results = resp.json() or []
-            logger.info("Bright Data results ready. profiles=%s", len(results))
+            results = orjson.loads(resp.content) or []
+            logger.info(
+                "Bright Data results ready. snapshot_id=%s records=%s",
+                snapshot_id,
+                len(results),
+            )
             return results
 
 
+class RequestLimiter:
+    """
+    Request and token budget for the OpenAI API, for use on one event loop.
+
+    Both budgets refill continuously up to one minute's worth of `max_rpm`
+    requests and `max_tpm` tokens, so requests are paced before OpenAI has to
+    reject them. A non-positive limit disables that budget. The request bucket
+    always holds at least one request, so limits below 1 RPM still let a
+    request through every 1/`max_rpm` minutes.
+    """
+
+    def __init__(self, max_rpm: float, max_tpm: float) -> None:
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.available_requests = max(max_rpm, 1)
+        self.available_tokens = max_tpm
+        self.last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        minutes = (now - self.last_refill) / 60
+        self.last_refill = now
+        self.available_requests = min(
+            max(self.max_rpm, 1), self.available_requests + minutes * self.max_rpm
+        )
+        self.available_tokens = min(
+            self.max_tpm, self.available_tokens + minutes * self.max_tpm
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and `tokens` tokens are available, then use them."""
+        while True:
+            self._refill()
+            # A single oversized request only needs a full bucket
+            tokens_needed = min(tokens, self.max_tpm)
+            waits = []
+            if self.max_rpm > 0 and self.available_requests < 1:
+                waits.append((1 - self.available_requests) * 60 / self.max_rpm)
+            if self.max_tpm > 0 and self.available_tokens < tokens_needed:
+                waits.append(
+                    (tokens_needed - self.available_tokens) * 60 / self.max_tpm
+                )
+            if not waits:
+                if self.max_rpm > 0:
+                    self.available_requests -= 1
+                if self.max_tpm > 0:
+                    self.available_tokens -= tokens_needed
+                return
+            await asyncio.sleep(max(waits))
+
+    def throttle(self) -> None:
+        """Lower both limits by 10% after OpenAI rate-limited a request anyway."""
+        self.max_rpm *= 0.9
+        self.max_tpm *= 0.9
+        logger.warning(
+            "Lowered OpenAI limits to %.0f RPM / %.0f TPM.", self.max_rpm, self.max_tpm
+        )
+
+
 class OutreachPipeline:
     """End-to-end enrichment + personalization pipeline."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, use_message_cache: bool = True, use_batch_api: bool = False
+    ) -> None:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        self.openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        self.use_message_cache = use_message_cache
+        self.use_batch_api = use_batch_api
+        self.openai_client = (
+            AsyncOpenAI(
+                api_key=OPENAI_API_KEY,
+                timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=5.0),
+                max_retries=3,
+            )
+            if OPENAI_API_KEY
+            else None
+        )
+        self.rate_limiter = RequestLimiter(MAX_RPM, MAX_TPM)
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        # Bright Data records from earlier runs, so overlapping leads are not re-scraped
+        SCRAPE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        self.cache = sqlite3.connect(SCRAPE_CACHE_PATH, check_same_thread=False)
+        self.cache.execute(
+            "CREATE TABLE IF NOT EXISTS scraped_records "
+            "(normalized_url TEXT PRIMARY KEY, scraped_at INTEGER, payload BLOB)"
+        )
+        self._cache_lock = threading.Lock()
+        self._brightdata: Optional[BrightDataClient] = None
+        self._client_lock = threading.Lock()
+        # Messages by prompt hash, so unchanged leads are not sent to the LLM again
+        self.message_cache = sqlite3.connect(MESSAGE_CACHE_PATH)
+        self.message_cache.execute(
+            "CREATE TABLE IF NOT EXISTS messages "
+            "(key TEXT PRIMARY KEY, message TEXT, created_at INTEGER)"
+        )
 
     def run(self) -> None:
         """Execute the pipeline."""
         logger.info("=== Starting Outreach Pipeline ===")
-        leads_df = self._load_leads()
-        profiles = self._fetch_profiles(leads_df)
-        companies = self._fetch_companies(leads_df)
-        merged_df = self._merge_leads_with_profiles(leads_df, profiles, companies)
-        personalized_df = self._personalize_messages(merged_df)
-        self._export_csv(personalized_df)
+        try:
+            leads_df = self._load_leads()
+            # The profile and company scrapes are independent Bright Data jobs
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                profiles_future = executor.submit(self._fetch_profiles, leads_df)
+                companies_future = executor.submit(self._fetch_companies, leads_df)
+                profiles = profiles_future.result()
+                companies = companies_future.result()
+            merged_df = self._merge_leads_with_profiles(leads_df, profiles, companies)
+            personalized_df = self._personalize_messages(merged_df)
+            self._export_csv(personalized_df)
+        finally:
+            self.cache.close()
+            self.message_cache.close()
         logger.info("=== Pipeline complete. leads=%s ===", len(personalized_df))
 
     def _load_leads(self) -> pd.DataFrame:
@@ -171,6 +441,16 @@ class OutreachPipeline:
             raise ValueError(
                 f"Missing required columns in leads CSV: {sorted(missing)}"
             )
+        # Clean the URL columns once; later steps use them as-is
+        df["profile_url"] = df["profile_url"].fillna("").astype(str).str.strip()
+        df["company_url"] = (
+            df["company_url"].fillna("").astype(str).str.strip()
+            if "company_url" in df.columns
+            else ""
+        )
+        # Keys to dedupe, cache and join on; the original URLs are exported
+        df["profile_key"] = df["profile_url"].map(_normalize_linkedin_url)
+        df["company_key"] = df["company_url"].map(_normalize_linkedin_url)
         logger.info("Loaded leads CSV with %s rows.", len(df))
         return df
 
@@ -184,174 +464,520 @@ class OutreachPipeline:
             path = Path(LOCAL_PROFILES_PATH)
             if not path.exists():
                 raise FileNotFoundError(f"LOCAL_PROFILES_PATH not found: {path}")
-            with path.open() as f:
-                data = json.load(f)
+            data = orjson.loads(path.read_bytes())
             logger.info("Loaded %s profiles from %s", len(data), path)
             return data
 
-        client = BrightDataClient(BRIGHTDATA_API_KEY, PROFILE_DATASET_ID)
-        profile_urls = (
-            leads_df["profile_url"].dropna().astype(str).str.strip().unique().tolist()
+        profile_urls = _dedupe_urls(
+            leads_df["profile_url"].map(_canonical_linkedin_url),
+            leads_df["profile_key"],
         )
         if not profile_urls:
             raise ValueError("No profile_url values found in the leads file.")
 
-        submission = client.submit(profile_urls)
-        if isinstance(submission, list):
-            results = submission
-        else:
-            results = client.poll_results(submission)
+        results = self._scrape(PROFILE_DATASET_ID, profile_urls)
         output_path = OUTPUT_DIR / _timestamped_filename("enriched_profiles", "json")
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        output_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         logger.info("Saved raw Bright Data profile results to %s", output_path)
         return results
 
     def _fetch_companies(self, leads_df: pd.DataFrame) -> List[Dict]:
         """Fetch LinkedIn company data when company URLs are provided."""
-        company_urls = (
-            leads_df["company_url"].dropna().astype(str).str.strip().unique().tolist()
-            if "company_url" in leads_df.columns
-            else []
+        company_urls = _dedupe_urls(
+            leads_df["company_url"].map(_canonical_linkedin_url),
+            leads_df["company_key"],
         )
         if not company_urls:
             return []
 
-        client = BrightDataClient(BRIGHTDATA_API_KEY, COMPANY_DATASET_ID)
-        submission = client.submit(company_urls)
-        if isinstance(submission, list):
-            results = submission
-        else:
-            results = client.poll_results(submission)
+        results = self._scrape(COMPANY_DATASET_ID, company_urls)
         output_path = OUTPUT_DIR / _timestamped_filename("enriched_companies", "json")
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        output_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         logger.info("Saved raw Bright Data company results to %s", output_path)
         return results
 
+    def _scrape(self, dataset_id: str, urls: List[str]) -> List[Dict]:
+        """Return Bright Data records for `urls`, scraping only uncached ones."""
+        results, to_scrape = self._split_cached(urls)
+        if results:
+            logger.info(
+                "Using %s cached Bright Data records; %s URLs left to scrape.",
+                len(results),
+                len(to_scrape),
+            )
+        if not to_scrape:
+            return results
+
+        client = self._brightdata_client()
+        fresh = self._resume_pending(client, dataset_id, to_scrape)
+        if fresh is None:
+            submission = client.submit(dataset_id, to_scrape)
+            if isinstance(submission, list):
+                fresh = submission
+            else:
+                # Recorded so a crashed run can pick the snapshot up again
+                _pending_path(dataset_id).write_bytes(
+                    orjson.dumps(
+                        {
+                            "snapshot_id": submission,
+                            "submitted_at": int(time.time()),
+                            "urls_hash": _urls_hash(to_scrape),
+                        }
+                    )
+                )
+                fresh = client.poll_results(submission)
+        _pending_path(dataset_id).unlink(missing_ok=True)
+        self._cache_put(fresh)
+        return results + fresh
+
+    def _brightdata_client(self) -> BrightDataClient:
+        """Return the Bright Data client, creating it on first use."""
+        # Shared by the profile and company scrapes, so both use one
+        # connection pool
+        with self._client_lock:
+            if self._brightdata is None:
+                self._brightdata = BrightDataClient(BRIGHTDATA_API_KEY)
+            return self._brightdata
+
+    def _resume_pending(
+        self, client: BrightDataClient, dataset_id: str, urls: List[str]
+    ) -> Optional[List[Dict]]:
+        """
+        Poll the snapshot an earlier run submitted for the same URLs, if any.
+
+        Returns None when there is no such snapshot, or it is too old or
+        Bright Data no longer serves it, so the URLs should be submitted again.
+        """
+        path = _pending_path(dataset_id)
+        try:
+            state = orjson.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if (
+            state.get("urls_hash") != _urls_hash(urls)
+            or time.time() - state.get("submitted_at", 0) > _PENDING_SNAPSHOT_MAX_AGE_S
+        ):
+            return None
+
+        snapshot_id = state["snapshot_id"]
+        logger.info(
+            "Resuming Bright Data snapshot %s from an earlier run.", snapshot_id
+        )
+        try:
+            return client.poll_results(snapshot_id)
+        except requests.HTTPError as err:
+            logger.warning(
+                "Could not resume snapshot %s (%s); submitting again.", snapshot_id, err
+            )
+            return None
+
+    def _split_cached(self, urls: List[str]) -> Tuple[List[Dict], List[str]]:
+        """Return fresh cached records, and the URLs that need scraping."""
+        oldest = int(time.time()) - SCRAPE_CACHE_TTL_SECONDS
+        results: List[Dict] = []
+        missing: List[str] = []
+        for url in urls:
+            with self._cache_lock:
+                row = self.cache.execute(
+                    "SELECT payload FROM scraped_records "
+                    "WHERE normalized_url = ? AND scraped_at > ?",
+                    (_normalize_linkedin_url(url), oldest),
+                ).fetchone()
+            if row:
+                results.append(orjson.loads(zlib.decompress(row[0])))
+            else:
+                missing.append(url)
+        return results, missing
+
+    def _cache_put(self, records: List[Dict]) -> None:
+        """Cache scraped records by URL, skipping records that report an error."""
+        now = int(time.time())
+        rows = [
+            (
+                _normalize_linkedin_url(_record_url(record)),
+                now,
+                zlib.compress(orjson.dumps(record)),
+            )
+            for record in records
+            if isinstance(record, dict)
+            and _record_url(record)
+            and "error" not in record
+        ]
+        with self._cache_lock:
+            self.cache.executemany(
+                "INSERT OR REPLACE INTO scraped_records VALUES (?, ?, ?)", rows
+            )
+            self.cache.commit()
+
     def _merge_leads_with_profiles(
         self, leads_df: pd.DataFrame, profiles: List[Dict], companies: List[Dict]
     ) -> pd.DataFrame:
         """Merge Bright Data profile and company data into the lead list."""
-        profiles_by_url: Dict[str, Dict] = {}
-        for p in profiles:
-            if isinstance(p, dict):
-                url = p.get("url") or p.get("profile_url") or p.get("input_url")
-                if url:
-                    profiles_by_url[url] = p
-
-        companies_by_url: Dict[str, Dict] = {}
-        for c in companies:
-            if isinstance(c, dict):
-                url = c.get("url") or c.get("input_url")
-                if url:
-                    companies_by_url[url] = c
-
-        merged: List[Dict] = []
-        for _, lead in leads_df.iterrows():
-            profile_url = str(lead.get("profile_url", "")).strip()
-            company_url = (
-                str(lead.get("company_url", "")).strip()
-                if "company_url" in leads_df.columns
-                else ""
-            )
-
-            profile = profiles_by_url.get(profile_url, {})
-            company_rec = companies_by_url.get(company_url, {})
+        profiles_df = _records_frame(
+            profiles,
+            "profile_key",
+            {
+                "headline": "p_headline",
+                "summary": "p_summary",
+                "about": "p_about",
+                "location": "p_location",
+                "city": "p_city",
+                "educations_details": "p_education",
+            },
+        )
+        companies_df = _records_frame(
+            companies,
+            "company_key",
+            {
+                "name": "c_name",
+                "about": "c_about",
+                "industries": "c_industry",
+                "company_size": "c_size",
+                "website": "c_website",
+            },
+        )
 
-            headline = profile.get("headline", "") or lead.get("title", "")
-            company = ""
-            if isinstance(headline, str) and " at " in headline:
-                company = headline.split(" at ")[-1].strip()
-            company = company or lead.get("company", "") or company_rec.get("name", "")
+        lead_columns = [c for c in _MERGED_LEAD_COLUMNS if c in leads_df.columns]
+        merged = (
+            leads_df[lead_columns]
+            .merge(profiles_df, on="profile_key", how="left")
+            .merge(companies_df, on="company_key", how="left")
+        )
+        blank = pd.Series("", index=merged.index)
 
-            merged.append(
-                {
-                    "email": lead.get("email", ""),
-                    "first_name": lead.get("first_name", ""),
-                    "last_name": lead.get("last_name", ""),
-                    "company": company,
-                    "title": headline,
-                    "about": profile.get("summary", "")
-                    or profile.get("about", "")
-                    or lead.get("about", ""),
-                    "location": profile.get("location", "") or profile.get("city", ""),
-                    "education": profile.get("educations_details", ""),
-                    "profile_url": profile_url,
-                    "company_url": company_url,
-                    "company_about": company_rec.get("about", ""),
-                    "company_industry": company_rec.get("industries", ""),
-                    "company_size": company_rec.get("company_size", ""),
-                    "company_website": company_rec.get("website", ""),
-                }
-            )
+        headline = _coalesce(merged["p_headline"], merged.get("title", blank))
+        has_company = headline.str.contains(" at ", regex=False).fillna(False)
+        company_from_headline = (
+            headline.str.split(" at ").str[-1].str.strip().where(has_company, "")
+        )
 
         logger.info(
             "Merged leads with %s profiles and %s companies.",
-            len(profiles_by_url),
-            len(companies_by_url),
+            len(profiles_df),
+            len(companies_df),
+        )
+        result = pd.DataFrame(
+            {
+                "email": merged.get("email", blank),
+                "first_name": merged.get("first_name", blank),
+                "last_name": merged.get("last_name", blank),
+                "company": _coalesce(
+                    company_from_headline,
+                    merged.get("company", blank),
+                    merged["c_name"],
+                ),
+                "title": headline,
+                "about": _coalesce(
+                    merged["p_summary"], merged["p_about"], merged.get("about", blank)
+                ),
+                "location": _coalesce(merged["p_location"], merged["p_city"]),
+                "education": merged["p_education"].fillna(""),
+                "profile_url": merged["profile_url"],
+                "company_url": merged["company_url"],
+                "company_about": merged["c_about"].fillna(""),
+                "company_industry": merged["c_industry"].fillna(""),
+                "company_size": merged["c_size"].fillna(""),
+                "company_website": merged["c_website"].fillna(""),
+            }
         )
-        return pd.DataFrame(merged)
+        for column, limit in _FIELD_LIMITS.items():
+            result[column] = result[column].astype(str).str[:limit]
+        return result
 
     def _personalize_messages(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Generate personalized messages for each lead."""
-        if not self.openai_client:
-            raise ValueError("OPENAI_API_KEY is required for personalization.")
+        """
+        Generate personalized messages for each lead.
 
-        messages: List[str] = []
-        for _, row in df.iterrows():
-            msg = self._generate_personalized_message(row.to_dict())
-            messages.append(msg)
+        Leads whose prompt matches a cached message reuse it, and leads with
+        identical prompts share one generated message.
+        """
+        prospects = df.to_dict(orient="records")
+        keys = [_message_key(prospect) for prospect in prospects]
+        messages_by_key = (
+            self._cached_messages(set(keys)) if self.use_message_cache else {}
+        )
+        pending: Dict[str, Dict] = {}
+        for key, prospect in zip(keys, prospects):
+            if key not in messages_by_key:
+                pending.setdefault(key, prospect)
+        logger.info(
+            "Generating %s messages (%s leads reuse a cached or duplicate message).",
+            len(pending),
+            len(prospects) - len(pending),
+        )
+
+        if pending:
+            if not self.openai_client:
+                raise ValueError("OPENAI_API_KEY is required for personalization.")
+            generate = (
+                self._generate_messages_batch_api
+                if self.use_batch_api
+                else self._generate_messages
+            )
+            generated = asyncio.run(generate(list(pending.values())))
+            fresh = {key: message for key, message in zip(pending, generated)}
+            self._cache_messages(fresh)
+            messages_by_key.update(fresh)
+        messages = [messages_by_key[key] for key in keys]
 
         df = df.copy()
         df["personalized_message"] = messages
         df["custom_field_1"] = df["personalized_message"]
         return df
 
-    def _generate_personalized_message(self, prospect: Dict) -> str:
-        """Call the LLM to create a short personalized cold email."""
-        about = prospect.get("about", "") or ""
+    def _cached_messages(self, keys: Set[str]) -> Dict[str, str]:
+        """Return cached messages for the prompt hashes in `keys`."""
+        cached: Dict[str, str] = {}
+        for key in keys:
+            row = self.message_cache.execute(
+                "SELECT message FROM messages WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                cached[key] = row[0]
+        return cached
+
+    def _cache_messages(self, messages: Dict[str, str]) -> None:
+        """Cache generated messages by prompt hash; failed (empty) ones are skipped."""
+        now = int(time.time())
+        self.message_cache.executemany(
+            "INSERT OR REPLACE INTO messages VALUES (?, ?, ?)",
+            [(key, message, now) for key, message in messages.items() if message],
+        )
+        self.message_cache.commit()
+
+    async def _generate_messages(self, prospects: List[Dict]) -> List[str]:
+        """
+        Generate messages for all prospects, LLM_BATCH_SIZE prospects per
+        request and LLM_CONCURRENCY requests at a time.
+
+        A prospect whose request fails (already logged) gets an empty message
+        instead of aborting the rest of the run.
+        """
+        semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+        batch_size = max(1, LLM_BATCH_SIZE)
+        batches = [
+            prospects[start : start + batch_size]
+            for start in range(0, len(prospects), batch_size)
+        ]
+
+        async def generate(batch: List[Dict]) -> List[Union[str, BaseException]]:
+            async with semaphore:
+                if len(batch) == 1:
+                    return [await self._generate_personalized_message(batch[0])]
+                return await self._generate_batch_messages(batch)
+
+        try:
+            batch_results = await asyncio.gather(
+                *(generate(batch) for batch in batches), return_exceptions=True
+            )
+        finally:
+            # The client's connections belong to this event loop
+            await self.openai_client.close()
+
+        results: List[Union[str, BaseException]] = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, BaseException):
+                results.extend([batch_result] * len(batch))
+            else:
+                results.extend(batch_result)
+
+        logger.info(
+            "OpenAI usage: prompt_tokens=%s completion_tokens=%s",
+            self.prompt_tokens,
+            self.completion_tokens,
+        )
+        failed = sum(isinstance(result, BaseException) for result in results)
+        if failed:
+            logger.warning(
+                "Failed to generate %s of %s messages.", failed, len(results)
+            )
+        return [
+            "" if isinstance(result, BaseException) else result for result in results
+        ]
+
+    async def _generate_messages_batch_api(self, prospects: List[Dict]) -> List[str]:
+        """
+        Generate one message per prospect through the OpenAI Batch API.
+
+        Batches cost half as much and use a separate rate limit, but can take
+        up to 24 hours. A prospect whose request fails gets an empty message.
+        """
+        requests_jsonl = b"\n".join(
+            orjson.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": LLM_MODEL,
+                        "max_completion_tokens": LLM_MAX_OUTPUT_TOKENS,
+                        "messages": [
+                            {"role": "user", "content": _prospect_prompt(prospect)}
+                        ],
+                    },
+                }
+            )
+            for index, prospect in enumerate(prospects)
+        )
+        messages = [""] * len(prospects)
+        try:
+            input_file = await self.openai_client.files.create(
+                file=("messages.jsonl", requests_jsonl), purpose="batch"
+            )
+            batch = await self.openai_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info(
+                "Submitted OpenAI batch %s with %s requests.", batch.id, len(prospects)
+            )
+            while batch.status not in _BATCH_TERMINAL_STATUSES:
+                await asyncio.sleep(BATCH_API_POLL_SECONDS)
+                batch = await self.openai_client.batches.retrieve(batch.id)
+                counts = batch.request_counts
+                logger.info(
+                    "Waiting for OpenAI batch %s... status=%s completed=%s/%s",
+                    batch.id,
+                    batch.status,
+                    counts.completed if counts else 0,
+                    counts.total if counts else len(prospects),
+                )
+            if batch.status != "completed":
+                logger.error("OpenAI batch %s ended as %s.", batch.id, batch.status)
+
+            # An expired batch still returns the requests it finished
+            if batch.output_file_id:
+                output = await self.openai_client.files.content(batch.output_file_id)
+                for line in output.content.splitlines():
+                    result = orjson.loads(line)
+                    response = result.get("response") or {}
+                    if response.get("status_code") != 200:
+                        continue
+                    body = response["body"]
+                    content = body["choices"][0]["message"]["content"] or ""
+                    messages[int(result["custom_id"])] = content.strip()
+                    usage = body.get("usage") or {}
+                    self.prompt_tokens += usage.get("prompt_tokens", 0)
+                    self.completion_tokens += usage.get("completion_tokens", 0)
+        finally:
+            await self.openai_client.close()
+
+        logger.info(
+            "OpenAI usage: prompt_tokens=%s completion_tokens=%s",
+            self.prompt_tokens,
+            self.completion_tokens,
+        )
+        failed = messages.count("")
+        if failed:
+            logger.warning(
+                "Failed to generate %s of %s messages.", failed, len(messages)
+            )
+        return messages
+
+    async def _generate_batch_messages(
+        self, batch: List[Dict]
+    ) -> List[Union[str, BaseException]]:
+        """
+        Ask for one message per prospect in a single JSON-mode request.
+
+        Prospects the reply does not cover, or every prospect if the reply is
+        not valid JSON or the request is rejected, are generated one request
+        at a time instead.
+        """
+        prospect_blocks = "".join(
+            f"Prospect {number}:\n{_prospect_details(prospect)}\n"
+            for number, prospect in enumerate(batch, start=1)
+        )
         prompt = (
-            "You are a sales outreach specialist. Craft a concise, highly personalized cold email "
-            "that feels written just for this person. Limit to 140-160 words, avoid fluff, and make one clear CTA.\n\n"
-            "Use the data below thoughtfully—reference only what is relevant and authentic. If a field is empty, just skip it.\n"
-            f"- Name: {prospect.get('first_name', '')} {prospect.get('last_name', '')}\n"
-            f"- Title: {prospect.get('title', '')}\n"
-            f"- Location: {prospect.get('location', '')}\n"
-            f"- Education: {prospect.get('education', '')}\n"
-            f"- About/Bio: {about[:600]}\n"
-            f"- Company: {prospect.get('company', '')}\n"
-            f"- Company about: {prospect.get('company_about', '')}\n"
-            f"- Company industry: {prospect.get('company_industry', '')}\n"
-            f"- Company size: {prospect.get('company_size', '')}\n"
-            f"- Company website: {prospect.get('company_website', '')}\n\n"
-            "Product: [YOUR_PRODUCT_DESCRIPTION_HERE]\n\n"
-            "Structure:\n"
-            "1) One-line opener that shows you've actually read their background (title, location, education, or company mission—pick the best hook).\n"
-            "2) One-sentence bridge linking their context to your product's specific value (be concrete: metrics, outcomes, or workflow saved).\n"
-            "3) One short bullet or micro-example that proves the benefit (no jargon; relevant to media/tech audiences if applicable).\n"
-            "4) Close with a single, low-friction CTA (e.g., 10-minute intro this week) and offer to share a tailored example.\n"
-            "Keep tone warm, professional, and direct."
+            f"Write a separate email for each of the {len(batch)} prospects below, "
+            "following these instructions for every one of them.\n\n"
+            + _PROMPT_INTRO
+            + "\n"
+            + prospect_blocks
+            + "\n"
+            + _PROMPT_GUIDELINES
+            + "\n\nRespond with a JSON object of the form "
+            '{"messages": [{"index": <prospect number>, "message": "<email text>"}]} '
+            "containing one entry per prospect."
         )
+        try:
+            content = await self._complete(
+                prompt,
+                LLM_MAX_OUTPUT_TOKENS * len(batch),
+                response_format={"type": "json_object"},
+            )
+        except BadRequestError:
+            # One prospect can get the whole batch rejected; retry them singly
+            content = ""
+
+        messages: Dict[int, str] = {}
+        try:
+            for entry in orjson.loads(content)["messages"]:
+                messages[int(entry["index"])] = str(entry["message"]).strip()
+        except (ValueError, KeyError, TypeError) as err:
+            logger.warning("Could not parse batched LLM reply: %s", err)
+
+        missing = [
+            number for number in range(1, len(batch) + 1) if not messages.get(number)
+        ]
+        if missing:
+            logger.warning(
+                "Batched reply covered %s of %s prospects; generating the rest one at a time.",
+                len(batch) - len(missing),
+                len(batch),
+            )
+            fallbacks = await asyncio.gather(
+                *(
+                    self._generate_personalized_message(batch[number - 1])
+                    for number in missing
+                ),
+                return_exceptions=True,
+            )
+            messages.update(zip(missing, fallbacks))
+        return [messages[number] for number in range(1, len(batch) + 1)]
 
+    async def _generate_personalized_message(self, prospect: Dict) -> str:
+        """Call the LLM to create a short personalized cold email."""
         try:
-            response = self.openai_client.chat.completions.create(
+            return await self._complete(
+                _prospect_prompt(prospect), LLM_MAX_OUTPUT_TOKENS
+            )
+        except APIError:
+            raise  # Already logged by _complete
+        except Exception as exc:  # pragma: no cover - protective catch for runtime use
+            logger.error(
+                "Failed to generate message for %s: %s", prospect, exc, exc_info=True
+            )
+            raise
+
+    async def _complete(self, prompt: str, max_tokens: int, **kwargs) -> str:
+        """Send one chat completion within the rate limits and return its text."""
+        # Roughly 4 characters per token, plus the most the reply may use
+        await self.rate_limiter.acquire(len(prompt) // 4 + max_tokens)
+        try:
+            response = await self.openai_client.chat.completions.create(
                 model=LLM_MODEL,
-                max_completion_tokens=400,
+                max_completion_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
+                **kwargs,
             )
-            return (response.choices[0].message.content or "").strip()
         except RateLimitError as err:
             logger.error("OpenAI rate limit hit: %s", err, exc_info=True)
+            self.rate_limiter.throttle()
             raise
         except APIError as api_err:
             logger.error("OpenAI API error: %s", api_err, exc_info=True)
             raise
-        except Exception as exc:  # pragma: no cover - protective catch for runtime use
-            logger.error(
-                "Failed to generate message for %s: %s", prospect, exc, exc_info=True
+        if response.usage:
+            self.prompt_tokens += response.usage.prompt_tokens
+            self.completion_tokens += response.usage.completion_tokens
+            logger.debug(
+                "OpenAI usage: prompt_tokens=%s completion_tokens=%s",
+                response.usage.prompt_tokens,
+                response.usage.completion_tokens,
             )
-            raise
+        return (response.choices[0].message.content or "").strip()
 
     def _export_csv(self, df: pd.DataFrame) -> Path:
         """Export to UTF-8 CSV with timestamped filename."""
@@ -367,16 +993,83 @@ class OutreachPipeline:
             "company_url",
             "company_about",
         ]
-        df.to_csv(output_file, index=False, columns=columns, encoding="utf-8")
+        df.to_csv(
+            output_file,
+            index=False,
+            columns=columns,
+            encoding="utf-8",
+            chunksize=_EXPORT_CHUNK_ROWS,
+        )
         logger.info("Exported %s leads to %s", len(df), output_file)
         return output_file
 
 
+def _prompt_fields(prospect: Dict) -> Dict[str, str]:
+    """Return the prospect as template fields; missing fields format as empty."""
+    return defaultdict(str, prospect)
+
+
+def _prospect_details(prospect: Dict) -> str:
+    """Format the prospect fields the LLM writes from, one per line."""
+    return _PROSPECT_TEMPLATE.format_map(_prompt_fields(prospect))
+
+
+def _prospect_prompt(prospect: Dict) -> str:
+    """Return the prompt for a message written for one prospect."""
+    return PROMPT_TEMPLATE.format_map(_prompt_fields(prospect))
+
+
+def _message_key(prospect: Dict) -> str:
+    """Return the cache key for a prospect's message: a hash of model and prompt."""
+    return hashlib.sha256(
+        f"{LLM_MODEL}\n{_prospect_prompt(prospect)}".encode()
+    ).hexdigest()
+
+
+def _records_frame(
+    records: List[Dict], url_column: str, columns: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Build a frame of Bright Data records keyed by their canonical URL in
+    `url_column`.
+
+    `columns` maps the record fields to keep to their names in the frame. When
+    several records share a URL, the last one wins.
+    """
+    records = [r for r in records if isinstance(r, dict) and _record_url(r)]
+    # Selecting the fields up front skips the scraped fields nothing reads
+    df = pd.DataFrame(records, columns=list(columns)).rename(columns=columns)
+    df.insert(0, url_column, [_normalize_linkedin_url(_record_url(r)) for r in records])
+    return df.drop_duplicates(url_column, keep="last")
+
+
+def _coalesce(*columns: pd.Series) -> pd.Series:
+    """Return, row by row, the first value that is neither missing nor empty."""
+    result = columns[0]
+    for column in columns[1:]:
+        result = result.where(result.notna() & (result != ""), column)
+    return result.fillna("")
+
+
 def main() -> None:
-    pipeline = OutreachPipeline()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="regenerate every message instead of reusing cached ones",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="generate messages through the OpenAI Batch API: half the cost, "
+        "but results can take up to 24 hours",
+    )
+    args = parser.parse_args()
+    pipeline = OutreachPipeline(
+        use_message_cache=not args.no_cache, use_batch_api=args.batch
+    )
     pipeline.run()
 
 
 if __name__ == "__main__":
     main()
-
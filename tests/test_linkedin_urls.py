@@ -0,0 +1,96 @@
+"""Tests for how personalization canonicalizes and dedupes LinkedIn URLs."""
+
+import unittest
+
+import pandas as pd
+
+from personalization.pipeline import (
+    _canonical_linkedin_url,
+    _dedupe_urls,
+    _normalize_linkedin_url,
+    _records_frame,
+)
+
+
+class CanonicalLinkedInUrlTest(unittest.TestCase):
+    def test_linkedin_hosts_become_www(self) -> None:
+        for url in (
+            "https://uk.linkedin.com/in/Foo/",
+            "http://linkedin.com/in/Foo",
+            "linkedin.com/in/Foo",
+            "www.linkedin.com/in/Foo",
+            "HTTPS://WWW.LinkedIn.com/in/Foo",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(
+                    _canonical_linkedin_url(url), "https://www.linkedin.com/in/Foo"
+                )
+
+    def test_query_fragment_and_trailing_slash_are_dropped(self) -> None:
+        for url in (
+            " https://www.linkedin.com/in/foo/?trk=abc ",
+            "https://www.linkedin.com/in/foo#about",
+            "https://www.linkedin.com/in/foo/?trk=abc#about",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(
+                    _canonical_linkedin_url(url), "https://www.linkedin.com/in/foo"
+                )
+
+    def test_other_hosts_are_left_alone(self) -> None:
+        for url in (
+            "https://notlinkedin.com/in/foo",
+            "https://www.linkedin.com.example.io/in/foo",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(_canonical_linkedin_url(url), url)
+
+    def test_empty_url_stays_empty(self) -> None:
+        self.assertEqual(_canonical_linkedin_url("  "), "")
+
+
+class NormalizeLinkedInUrlTest(unittest.TestCase):
+    def test_variants_share_one_key(self) -> None:
+        variants = (
+            "https://uk.linkedin.com/in/Foo/",
+            "linkedin.com/in/foo",
+            "www.linkedin.com/in/FOO?trk=1",
+            "http://www.linkedin.com/in/foo#experience",
+        )
+        keys = {_normalize_linkedin_url(url) for url in variants}
+        self.assertEqual(keys, {"https://www.linkedin.com/in/foo"})
+
+
+class DedupeUrlsTest(unittest.TestCase):
+    def test_one_resolvable_url_per_key(self) -> None:
+        urls = pd.Series(
+            [
+                "https://uk.linkedin.com/in/Foo/",
+                "linkedin.com/in/foo?trk=1",
+                "",
+                "https://www.linkedin.com/in/bar",
+            ]
+        )
+        self.assertEqual(
+            _dedupe_urls(
+                urls.map(_canonical_linkedin_url), urls.map(_normalize_linkedin_url)
+            ),
+            ["https://www.linkedin.com/in/Foo", "https://www.linkedin.com/in/bar"],
+        )
+
+
+class RecordsFrameTest(unittest.TestCase):
+    def test_records_are_keyed_for_the_join(self) -> None:
+        frame = _records_frame(
+            [{"url": "https://www.linkedin.com/in/Foo", "headline": "CTO"}],
+            "profile_key",
+            {"headline": "p_headline"},
+        )
+        self.assertEqual(
+            frame["profile_key"].tolist(),
+            [_normalize_linkedin_url("linkedin.com/in/foo/#about")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()